@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends, Query
 from uuid import UUID
 from typing import Optional
@@ -30,9 +31,13 @@ def _parse_date_param(value: Optional[str], param_name: str) -> Optional[datetim
         )
 
 # Dependencies
+# Services are created once per process and reused across requests, so each
+# request does not build (and connect) a fresh Supabase client.
+@lru_cache()
 def get_db_service():
     return DatabaseService()
 
+@lru_cache()
 def get_rss_service():
     return RSSService()
 
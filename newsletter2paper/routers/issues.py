@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends
 from uuid import UUID
 from typing import List, Optional
@@ -70,7 +71,8 @@ class AddPublicationsRequest(BaseModel):
     publication_ids: List[UUID] = []  # Deprecated: use publications instead
     publications: Optional[List[PublicationSettings]] = None  # New format with settings
 
-# Dependency to get database service
+# Dependency to get database service (one shared instance per process)
+@lru_cache()
 def get_db_service():
     return DatabaseService()
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends
 from uuid import UUID
 from typing import List, Optional
@@ -13,7 +14,8 @@ class CreatePublicationRequest(BaseModel):
     rss_feed_url: str
     publisher: str
 
-# Dependency to get database service
+# Dependency to get database service (one shared instance per process)
+@lru_cache()
 def get_db_service():
     return DatabaseService()
 
@@ -5,6 +5,7 @@ Wrapper for calling the Go-based PDF generation CLI from Python.
 
 import os
 import json
+import asyncio
 import uuid
 import subprocess
 import logging
@@ -39,6 +40,10 @@ class GoPDFService:
         # Configuration
         self.go_container_name = os.getenv("GO_PDF_CONTAINER", "pdf-maker")
         self.go_binary_path = "/app/makepdf"
+        # Fetched article pages are cached on the shared volume so that
+        # overlapping issues don't re-download the same articles; the Go CLI
+        # prunes entries older than 4x --article-cache-ttl on each run
+        self.article_cache_dir = self.shared_dir / "article_cache"
         self.default_timeout = 120  # seconds
     
     def _generate_temp_paths(self) -> tuple[Path, Path]:
@@ -130,6 +135,7 @@ class GoPDFService:
                 "--articles-json", str(json_path),
                 "--output", str(pdf_path),
                 "--cleanup-images=false",  # Let Go handle its own cleanup
+                "--article-cache-dir", str(self.article_cache_dir),
             ]
             if keep_html:
                 cmd.append("--keep-html")
@@ -144,6 +150,7 @@ class GoPDFService:
                 "--articles-json", str(json_path),
                 "--output", str(pdf_path),
                 "--cleanup-images=false",
+                "--article-cache-dir", str(self.article_cache_dir),
             ]
             if keep_html:
                 cmd.append("--keep-html")
@@ -248,15 +255,23 @@ class GoPDFService:
             )
             
             # Write JSON to shared volume
+            # Serialize in one json.dumps call, which uses the C encoder
+            # (json.dump streams through the pure-Python one), and write it
+            # compact since the payload is read only by the Go CLI
             logger.debug(f"Writing article data to: {json_path}")
             with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(article_json, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(article_json, ensure_ascii=False, separators=(',', ':')))
             
             # Execute Go CLI
             logger.info("Calling Go PDF generator...")
             if has_per_article_settings:
                 logger.info("Using per-article image removal settings")
-            cli_result = self._execute_go_cli(json_path, pdf_path, keep_html, timeout, remove_images, has_per_article_settings)
+            # Run the blocking subprocess in a worker thread so the event loop
+            # keeps serving other requests while the Go CLI renders.
+            cli_result = await asyncio.to_thread(
+                self._execute_go_cli,
+                json_path, pdf_path, keep_html, timeout, remove_images, has_per_article_settings
+            )
             
             # Check if command succeeded
             if cli_result.returncode != 0:
@@ -273,24 +288,25 @@ class GoPDFService:
                 logger.error(result['error'])
                 return result
             
-            # Read generated PDF
-            logger.info(f"Reading generated PDF: {pdf_path}")
-            with open(pdf_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            logger.info(f"PDF size: {len(pdf_bytes)} bytes")
+            logger.info(f"Generated PDF: {pdf_path} ({pdf_path.stat().st_size} bytes)")
             
             # Generate output filename if not provided
             if not output_filename:
                 safe_title = "".join(c for c in issue_info.get('title', 'newsletter') 
                                    if c.isalnum() or c in (' ', '-', '_')).strip()
                 safe_title = safe_title.replace(' ', '_')[:20]
-                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+                now = datetime.now()
+                timestamp = f"{now.year:04d}-{now.month:02d}-{now.day:02d}_{now.hour:02d}-{now.minute:02d}"
                 output_filename = f"{safe_title}_{timestamp}"
             
             # Upload to Supabase storage
             logger.info("Uploading PDF to Supabase...")
-            supabase_url = self.storage_service.upload_pdf(pdf_bytes, output_filename)
+            # Hand the storage client the file path so it streams from disk
+            # rather than holding a second full copy of the PDF in memory.
+            # The storage client is synchronous, so upload from a worker thread.
+            supabase_url = await asyncio.to_thread(
+                self.storage_service.upload_pdf, pdf_path, output_filename
+            )
             
             result.update({
                 'success': True,
@@ -1,6 +1,9 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Union
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 from urllib.parse import urljoin, urlparse
 from datetime import datetime, timedelta, timezone
@@ -10,6 +13,26 @@ from models import Article, Publication
 
 from services.database_service import DatabaseService
 
+# Prefer the C-backed lxml parser for HTML feed discovery; fall back to the
+# pure-Python stdlib parser where lxml is not installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Likewise parse feed XML with lxml's C parser when it is available
+try:
+    from lxml import etree as FEED_ET
+    FEED_PARSE_ERRORS = (ET.ParseError, FEED_ET.XMLSyntaxError)
+except ImportError:
+    FEED_ET = ET
+    FEED_PARSE_ERRORS = (ET.ParseError,)
+
+# Feed discovery only looks at <link> and <a> tags, so the rest of the page
+# is skipped while parsing instead of being built into the tree
+FEED_LINK_STRAINER = SoupStrainer(['link', 'a'])
+
 DEFAULT_HEADERS = {
     'User-Agent': (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -18,9 +41,77 @@ DEFAULT_HEADERS = {
     )
 }
 
+# Per-field lookup paths for feed items, tried in order of preference. They are
+# built once here rather than for every item; ElementPath caches the compiled
+# form of each path, and dc: paths carry the namespace map they need.
+FEED_NAMESPACES = {
+    'content': 'http://purl.org/rss/1.0/modules/content/',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'atom': 'http://www.w3.org/2005/Atom',
+}
+ITEM_CONTENT_PATHS = (
+    'description',
+    'summary',
+    './/{http://purl.org/rss/1.0/modules/content/}encoded',
+    './/{http://www.w3.org/2005/Atom}summary',
+    './/{http://www.w3.org/2005/Atom}content',
+)
+ITEM_AUTHOR_PATHS = (
+    ('author', None),
+    ('dc:creator', FEED_NAMESPACES),
+    ('.//{http://www.w3.org/2005/Atom}author//{http://www.w3.org/2005/Atom}name', None),
+)
+ITEM_DATE_PATHS = (
+    ('pubDate', None),
+    ('dc:date', FEED_NAMESPACES),
+    ('.//{http://www.w3.org/2005/Atom}published', None),
+    ('.//{http://www.w3.org/2005/Atom}updated', None),
+)
+
+
+def _parse_feed_xml(xml_content: str):
+    """Parse feed XML text into its root element, using lxml when available."""
+    if FEED_ET is ET:
+        return ET.fromstring(xml_content)
+    # lxml rejects str input carrying an encoding declaration, so pass UTF-8
+    # bytes and override the declared encoding. To match ElementTree, comments
+    # and processing instructions are dropped (so itertext() yields the same
+    # joined text) and only entities declared in the document are expanded;
+    # external entities and network access stay off for untrusted feeds.
+    parser = FEED_ET.XMLParser(
+        encoding='utf-8',
+        resolve_entities='internal',
+        no_network=True,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    return FEED_ET.fromstring(xml_content.encode('utf-8'), parser)
+
+
+def _build_http_session(max_retries: Union[int, Retry] = 0) -> requests.Session:
+    """Create a pooled session that sends the default headers."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=max_retries,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class RSSService:
     # Class-level RSS feed cache: {feed_url: {'xml': content, 'fetched_at': datetime}}
     _rss_cache = {}
+    # Class-level HTTP sessions so keep-alive connections are pooled across
+    # all service instances (get_rss_service shares one, but the PDF router
+    # and CLI construct their own). Feed discovery probes many candidate URLs
+    # that are expected to fail, so _http never retries; only the final feed
+    # fetch in _feed_http retries transient errors.
+    _http = _build_http_session()
+    _feed_http = _build_http_session(Retry(total=2, backoff_factor=0.2))
     
     def __init__(self):
         """Initialize RSS service with database connection."""
@@ -73,7 +164,7 @@ class RSSService:
             if verbose:
                 logging.info(f"HEAD {webpage_url}")
             try:
-                head = requests.head(webpage_url, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+                head = self._http.head(webpage_url, timeout=timeout, allow_redirects=True)
                 ct = head.headers.get('content-type', '')
                 if verbose:
                     logging.info(f"  content-type: {ct}")
@@ -87,7 +178,7 @@ class RSSService:
             # GET the URL and parse HTML for <link rel=alternate> tags
             if verbose:
                 logging.info(f"GET {webpage_url}")
-            response = requests.get(webpage_url, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+            response = self._http.get(webpage_url, timeout=timeout, allow_redirects=True)
             response.raise_for_status()
 
             # If the fetched URL itself is a feed by content-type, return it
@@ -97,8 +188,15 @@ class RSSService:
                     logging.info(f"  page returned feed-like content-type: {ct}")
                 return response.url
 
-            content = response.text
-            soup = BeautifulSoup(content, 'html.parser')
+            # Pass raw bytes; when the server declares a charset, hand it to the
+            # parser so it can skip encoding detection
+            from_encoding = None
+            if 'charset=' in ct.lower():
+                from_encoding = ct.lower().split('charset=', 1)[1].split(';')[0].strip(' "\'') or None
+            soup = BeautifulSoup(
+                response.content, HTML_PARSER,
+                from_encoding=from_encoding, parse_only=FEED_LINK_STRAINER
+            )
 
             # Look for <link rel="alternate" type="application/rss+xml" href="...">
             link_tags = soup.find_all('link', rel=lambda x: x and 'alternate' in x.lower())
@@ -132,7 +230,7 @@ class RSSService:
                         logging.info(f"Checking candidate: {cand}")
                     # Try HEAD first
                     try:
-                        h = requests.head(cand, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+                        h = self._http.head(cand, timeout=timeout, allow_redirects=True)
                         cand_ct = h.headers.get('content-type', '')
                         if self._is_feed_content_type(cand_ct):
                             return h.url
@@ -140,7 +238,7 @@ class RSSService:
                         pass
 
                     # GET and check for XML root
-                    r = requests.get(cand, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+                    r = self._http.get(cand, timeout=timeout, allow_redirects=True)
                     r.raise_for_status()
                     ct = r.headers.get('content-type', '')
                     if self._is_feed_content_type(ct):
@@ -160,12 +258,12 @@ class RSSService:
                 try:
                     if verbose:
                         logging.info(f"Trying common path: {path}")
-                    r = requests.head(path, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+                    r = self._http.head(path, timeout=timeout, allow_redirects=True)
                     ct = r.headers.get('content-type', '')
                     if self._is_feed_content_type(ct):
                         return r.url
                     # Fallback to GET
-                    r = requests.get(path, headers=DEFAULT_HEADERS, timeout=timeout, allow_redirects=True)
+                    r = self._http.get(path, timeout=timeout, allow_redirects=True)
                     r.raise_for_status()
                     ct = r.headers.get('content-type', '')
                     if self._is_feed_content_type(ct):
@@ -403,7 +501,7 @@ class RSSService:
             logging.info(f"Fetching RSS feed from: {rss_url}")
         
         try:
-            response = requests.get(rss_url, headers=DEFAULT_HEADERS, timeout=30)
+            response = self._feed_http.get(rss_url, timeout=30)
             response.raise_for_status()
             
             if verbose:
@@ -446,7 +544,6 @@ class RSSService:
         Raises:
             requests.RequestException: If there's an error fetching the feed
         """
-        import xml.etree.ElementTree as ET
         from datetime import datetime
         import email.utils
         from uuid import uuid4
@@ -454,11 +551,12 @@ class RSSService:
         articles = []
         
         try:
-            # Fetch the RSS feed using the new method
-            xml_content = self.fetch_rss_feed_content(feed_url, verbose=False)
+            # Fetch the RSS feed using the new method; the HTTP request is
+            # blocking, so run it in a worker thread to keep the loop free
+            xml_content = await asyncio.to_thread(self.fetch_rss_feed_content, feed_url, verbose=False)
             
             # Parse XML content
-            root = ET.fromstring(xml_content)
+            root = _parse_feed_xml(xml_content)
             
             # Find the channel element (works for both RSS and Atom feeds)
             channel_elem = root.find('.//channel')
@@ -469,13 +567,11 @@ class RSSService:
             rss_items = channel.findall('.//item')
             atom_items = channel.findall('.//{http://www.w3.org/2005/Atom}entry')
             items = rss_items if rss_items else atom_items
+            total_articles = len(items)
             
-            for item in items:
-                # Extract article data with namespace handling
-                ns = {'content': 'http://purl.org/rss/1.0/modules/content/',
-                     'dc': 'http://purl.org/dc/elements/1.1/',
-                     'atom': 'http://www.w3.org/2005/Atom'}
-                
+            # Only the requested page is turned into Article objects; the
+            # total still counts every item so callers can page on
+            for item in items[skip:skip + limit]:
                 # Get title (handle CDATA sections)
                 title_elem = item.find('title')
                 if title_elem is None:
@@ -488,15 +584,7 @@ class RSSService:
                 # Get description/subtitle with better content extraction
                 subtitle = None
                 # Try multiple content sources in order of preference
-                content_sources = [
-                    'description',
-                    'summary', 
-                    './/{http://purl.org/rss/1.0/modules/content/}encoded',
-                    './/{http://www.w3.org/2005/Atom}summary',
-                    './/{http://www.w3.org/2005/Atom}content'
-                ]
-                
-                for source in content_sources:
+                for source in ITEM_CONTENT_PATHS:
                     description_elem = item.find(source)
                     if description_elem is not None and description_elem.text:
                         # Handle possible CDATA content and strip HTML tags if needed
@@ -508,18 +596,8 @@ class RSSService:
                 
                 # Get author (handle CDATA sections and multiple author formats)
                 author = "Unknown Author"
-                author_sources = [
-                    'author',
-                    'dc:creator',
-                    './/{http://www.w3.org/2005/Atom}author//{http://www.w3.org/2005/Atom}name'
-                ]
-                
-                for source in author_sources:
-                    if source.startswith('dc:'):
-                        author_elem = item.find(source, ns)
-                    else:
-                        author_elem = item.find(source)
-                    
+                for source, namespaces in ITEM_AUTHOR_PATHS:
+                    author_elem = item.find(source, namespaces)
                     if author_elem is not None:
                         author_text = ''.join(author_elem.itertext()).strip()
                         if author_text:
@@ -544,19 +622,8 @@ class RSSService:
                 
                 # Get publication date with enhanced parsing
                 date_published = None
-                date_sources = [
-                    'pubDate',
-                    'dc:date',
-                    './/{http://www.w3.org/2005/Atom}published',
-                    './/{http://www.w3.org/2005/Atom}updated'
-                ]
-                
-                for source in date_sources:
-                    if source.startswith('dc:'):
-                        date_elem = item.find(source, ns)
-                    else:
-                        date_elem = item.find(source)
-                    
+                for source, namespaces in ITEM_DATE_PATHS:
+                    date_elem = item.find(source, namespaces)
                     if date_elem is not None and date_elem.text:
                         parsed_date = self.parse_rss_date(date_elem.text)
                         if parsed_date:
@@ -592,14 +659,9 @@ class RSSService:
                 for article in articles:
                     article.publication_id = publication['id']
 
-            total_articles = len(articles)
+            return articles, total_articles
             
-            # Apply pagination
-            paginated_articles = articles[skip:skip + limit]
-            
-            return paginated_articles, total_articles
-            
-        except (requests.RequestException, ET.ParseError) as e:
+        except (requests.RequestException, *FEED_PARSE_ERRORS) as e:
             logging.error(f"Error processing RSS feed {feed_url}: {str(e)}")
             raise
     
@@ -708,17 +770,13 @@ class RSSService:
                 cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
                 effective_end = None
             
-            articles_by_publication = {}
-            total_articles = 0
-            
-            for publication in publications:
+            async def fetch_publication_articles(publication: dict) -> tuple[str, List[dict]]:
                 pub_id = publication['id']
                 rss_url = publication.get('rss_feed_url')
                 
                 if not rss_url:
                     logging.warning(f"No RSS URL for publication {publication.get('title', pub_id)}")
-                    articles_by_publication[pub_id] = []
-                    continue
+                    return pub_id, []
                 
                 try:
                     # Fetch articles using the existing method
@@ -747,14 +805,23 @@ class RSSService:
                                 if len(recent_articles) >= max_articles_per_publication:
                                     break
                     
-                    articles_by_publication[pub_id] = recent_articles
-                    total_articles += len(recent_articles)
-                    
                     logging.info(f"Found {len(recent_articles)} recent articles for {publication.get('title', pub_id)}")
+                    return pub_id, recent_articles
                     
                 except Exception as e:
                     logging.error(f"Error fetching articles for publication {publication.get('title', pub_id)}: {str(e)}")
-                    articles_by_publication[pub_id] = []
+                    return pub_id, []
+            
+            # Fetch all publications' feeds concurrently
+            results = await asyncio.gather(
+                *(fetch_publication_articles(publication) for publication in publications)
+            )
+            
+            articles_by_publication = {}
+            total_articles = 0
+            for pub_id, recent_articles in results:
+                articles_by_publication[pub_id] = recent_articles
+                total_articles += len(recent_articles)
             
             return {
                 'issue': issue,
@@ -6,7 +6,8 @@ Handles file storage operations using Supabase storage.
 import os
 import logging
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
@@ -58,12 +59,19 @@ class StorageService:
                 "message": f"Cannot access bucket '{bucket_name}': {str(e)}"
             }
     
-    def upload_pdf(self, pdf_content: bytes, filename: str, bucket_name: str = "pdf_issues") -> str:
+    def upload_pdf(
+        self,
+        pdf_content: Union[bytes, str, Path],
+        filename: str,
+        bucket_name: str = "pdf_issues"
+    ) -> str:
         """
         Upload PDF content to Supabase storage and return a signed URL.
         
         Args:
-            pdf_content (bytes): PDF file content as bytes
+            pdf_content: PDF content as bytes, or a path to a PDF on disk. The
+                storage client opens paths itself and streams the file instead
+                of reading it into memory first.
             filename (str): Name for the file in storage
             bucket_name (str): Storage bucket name (default: "pdf_issues")
             
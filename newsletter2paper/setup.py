@@ -12,6 +12,7 @@ setup(
         "boto3",
         "weasyprint",
         "beautifulsoup4",
+        "lxml>=5.0",
         "requests",
     ],
     entry_points={
@@ -84,7 +84,7 @@ class TestFeedExtraction(unittest.TestCase):
                 loop.close()
         return wrapper
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @async_test
     async def test_get_articles(self, mock_get):
         """Test extracting articles from a feed."""
@@ -129,7 +129,7 @@ class TestFeedExtraction(unittest.TestCase):
             '08945b32-305a-467e-8117-b4390a47d981'
         )
         
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @async_test
     async def test_pagination(self, mock_get):
         """Test pagination of articles."""
@@ -198,7 +198,7 @@ class TestFeedExtraction(unittest.TestCase):
         except ET.ParseError as e:
             self.fail(f"Received invalid XML from feed: {str(e)}")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @async_test
     async def test_error_handling(self, mock_get):
         """Test handling of request errors."""
@@ -209,7 +209,7 @@ class TestFeedExtraction(unittest.TestCase):
         with self.assertRaises(Exception):
             await self.rss_service.get_articles(self.feed_url, skip=0, limit=10)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     @async_test
     async def test_required_fields(self, mock_get):
         """Test that all required fields are present in parsed articles."""
@@ -0,0 +1,98 @@
+"""Unit tests for the Go PDF service wrapper."""
+
+import asyncio
+import subprocess
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from services.go_pdf_service import GoPDFService
+
+
+class TestGoPDFServiceGeneration(unittest.TestCase):
+    """Test cases for GoPDFService.generate_pdf_from_issue."""
+
+    def setUp(self):
+        """Set up a service writing to a temporary shared directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        with patch('services.go_pdf_service.StorageService') as mock_storage:
+            self.service = GoPDFService(use_docker=False, shared_dir=self.tmp_dir.name)
+        self.storage = mock_storage.return_value
+        self.storage.upload_pdf.return_value = "https://storage.example.com/issue.pdf"
+        self.articles = [{'title': 'Test Article', 'content': '<p>Body</p>'}]
+        self.issue_info = {'id': 'issue-1', 'title': 'Weekly Digest'}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _fake_cli(self, calls):
+        """Return a fake _execute_go_cli that writes a PDF and records its thread."""
+        def fake_execute(json_path, pdf_path, *args, **kwargs):
+            calls.append(threading.current_thread())
+            Path(pdf_path).write_bytes(b"%PDF-1.4 test")
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        return fake_execute
+
+    def test_cli_runs_off_event_loop_thread(self):
+        """The Go CLI subprocess is executed in a worker thread, not on the loop."""
+        calls = []
+        self.service._execute_go_cli = self._fake_cli(calls)
+
+        result = asyncio.run(self.service.generate_pdf_from_issue(
+            'issue-1', self.articles, self.issue_info
+        ))
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(result['pdf_url'], "https://storage.example.com/issue.pdf")
+        self.assertEqual(len(calls), 1)
+        self.assertIsNot(calls[0], threading.main_thread())
+
+    def test_upload_streams_pdf_from_disk(self):
+        """The generated PDF is uploaded by path instead of being read into memory."""
+        self.service._execute_go_cli = self._fake_cli([])
+
+        result = asyncio.run(self.service.generate_pdf_from_issue(
+            'issue-1', self.articles, self.issue_info, output_filename="digest"
+        ))
+
+        self.assertTrue(result['success'], result['error'])
+        uploaded, filename = self.storage.upload_pdf.call_args[0]
+        self.assertIsInstance(uploaded, Path)
+        self.assertEqual(uploaded.suffix, '.pdf')
+        self.assertEqual(filename, "digest")
+
+    def test_upload_runs_off_event_loop_thread(self):
+        """The blocking storage upload is executed in a worker thread."""
+        upload_threads = []
+        self.service._execute_go_cli = self._fake_cli([])
+        self.storage.upload_pdf.side_effect = lambda *args: (
+            upload_threads.append(threading.current_thread()) or "https://storage.example.com/issue.pdf"
+        )
+
+        result = asyncio.run(self.service.generate_pdf_from_issue(
+            'issue-1', self.articles, self.issue_info
+        ))
+
+        self.assertTrue(result['success'], result['error'])
+        self.assertEqual(len(upload_threads), 1)
+        self.assertIsNot(upload_threads[0], threading.main_thread())
+
+    def test_cli_failure_reports_error(self):
+        """A non-zero exit code is surfaced in the result."""
+        self.service._execute_go_cli = MagicMock(return_value=subprocess.CompletedProcess(
+            args=[], returncode=1, stdout="", stderr="boom"
+        ))
+
+        result = asyncio.run(self.service.generate_pdf_from_issue(
+            'issue-1', self.articles, self.issue_info
+        ))
+
+        self.assertFalse(result['success'])
+        self.assertIn("boom", result['error'])
+        self.storage.upload_pdf.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 """Unit tests for enhanced RSS article extraction and utility methods."""
 
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock, AsyncMock
 import requests
@@ -100,6 +101,28 @@ class TestEnhancedContentExtraction(unittest.TestCase):
             </channel>
         </rss>'''
 
+    @patch('services.rss_service.RSSService.fetch_rss_feed_content')
+    def test_get_articles_comments_and_entities(self, mock_fetch):
+        """Test that comments and DTD entities don't change extracted text."""
+        mock_fetch.return_value = '''<?xml version="1.0"?>
+        <!DOCTYPE rss [<!ENTITY brand "Acme &amp; Co">]>
+        <rss version="2.0">
+            <channel>
+                <title>Test Feed</title>
+                <item>
+                    <title>Split<!-- ad slot -->Title from &brand;</title>
+                    <description>Before<?render inline?> after</description>
+                    <link>https://example.com/<!-- tracking -->entities</link>
+                </item>
+            </channel>
+        </rss>'''
+        
+        articles, _ = asyncio.run(self.rss_service.get_articles("https://example.com/feed"))
+        
+        self.assertEqual(articles[0].title, "SplitTitle from Acme & Co")
+        self.assertEqual(articles[0].subtitle, "Before after")
+        self.assertEqual(articles[0].content_url, "https://example.com/entities")
+
     @patch('services.rss_service.RSSService.fetch_rss_feed_content')
     async def test_get_articles_cdata_handling(self, mock_fetch):
         """Test article extraction with CDATA content."""
@@ -199,7 +222,7 @@ class TestUtilityMethods(unittest.TestCase):
         """Set up test fixtures."""
         self.rss_service = RSSService()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_rss_feed_content_valid(self, mock_get):
         """Test fetching valid RSS feed content."""
         valid_rss = '''<?xml version="1.0"?>
@@ -217,7 +240,7 @@ class TestUtilityMethods(unittest.TestCase):
         self.assertEqual(result, valid_rss)
         mock_get.assert_called_once()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_rss_feed_content_invalid(self, mock_get):
         """Test fetching invalid RSS feed content."""
         invalid_content = "<html><body>Not RSS</body></html>"
@@ -227,7 +250,7 @@ class TestUtilityMethods(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.rss_service.fetch_rss_feed_content("https://example.com/feed")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_rss_feed_content_request_error(self, mock_get):
         """Test fetching RSS feed content with request error."""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -235,6 +258,14 @@ class TestUtilityMethods(unittest.TestCase):
         with self.assertRaises(requests.RequestException):
             self.rss_service.fetch_rss_feed_content("https://example.com/feed")
 
+    def test_only_feed_fetches_retry(self):
+        """Discovery probes fail fast; the feed fetch retries transient errors."""
+        probe_retries = self.rss_service._http.get_adapter("https://example.com").max_retries
+        feed_retries = self.rss_service._feed_http.get_adapter("https://example.com").max_retries
+        
+        self.assertEqual(probe_retries.total, 0)
+        self.assertEqual(feed_retries.total, 2)
+
     async def test_fetch_articles_from_feeds_multiple_feeds(self):
         """Test fetching articles from multiple feeds."""
         feed_urls = [
@@ -63,8 +63,8 @@ class TestEnhancedFeedDiscovery(unittest.TestCase):
         
         self.assertEqual(paths, expected_paths)
 
-    @patch('requests.head')
-    @patch('requests.get')
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
     def test_get_feed_url_direct_feed(self, mock_get, mock_head):
         """Test feed discovery when URL is already a feed."""
         # Mock HEAD request to return feed content type
@@ -80,8 +80,8 @@ class TestEnhancedFeedDiscovery(unittest.TestCase):
         mock_head.assert_called_once()
         mock_get.assert_not_called()
 
-    @patch('requests.head')
-    @patch('requests.get')
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
     def test_get_feed_url_html_with_link_tags(self, mock_get, mock_head):
         """Test feed discovery from HTML with link tags."""
         # Mock HEAD requests: first for main page fails, second for candidate succeeds
@@ -108,8 +108,32 @@ class TestEnhancedFeedDiscovery(unittest.TestCase):
         
         self.assertEqual(result, "https://example.com/feed.xml")
 
-    @patch('requests.head')
-    @patch('requests.get')
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
+    def test_get_feed_url_html_with_declared_charset(self, mock_get, mock_head):
+        """Test feed discovery when the page declares its charset in the header."""
+        mock_head.side_effect = lambda url, **kwargs: (
+            MockResponse("", 200, {"content-type": "application/rss+xml"}, url=url)
+            if 'feed.xml' in url else MockResponse("", 200, {"content-type": "text/html"}, url=url)
+        )
+
+        html_content = '''
+        <html>
+        <head>
+            <title>Café Notes</title>
+            <link rel="alternate" type="application/rss+xml" href="/feed.xml" />
+        </head>
+        <body>Content</body>
+        </html>
+        '''
+        mock_get.return_value = MockResponse(html_content, 200, {"content-type": 'text/html; charset="UTF-8"'})
+
+        result = self.rss_service.get_feed_url(self.test_url)
+
+        self.assertEqual(result, "https://example.com/feed.xml")
+
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
     def test_get_feed_url_common_paths(self, mock_get, mock_head):
         """Test feed discovery using common paths."""
         # Mock HEAD request fails
@@ -126,8 +150,8 @@ class TestEnhancedFeedDiscovery(unittest.TestCase):
         
         self.assertEqual(result, "https://example.com/feed")
 
-    @patch('requests.head')
-    @patch('requests.get')
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
     def test_get_feed_url_not_found(self, mock_get, mock_head):
         """Test feed discovery when no feed is found."""
         # Mock all requests to fail or return non-feed content
@@ -144,7 +168,7 @@ class TestEnhancedFeedDiscovery(unittest.TestCase):
 
     def test_get_feed_url_adds_protocol(self):
         """Test that protocol is added to URLs without it."""
-        with patch('requests.head') as mock_head:
+        with patch('requests.Session.head') as mock_head:
             mock_head.return_value = MockResponse(
                 "", 200, 
                 {"content-type": "application/rss+xml"}, 
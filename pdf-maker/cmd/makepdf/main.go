@@ -8,6 +8,7 @@ import (
 	"strings"
 	"time"
 
+	"golang.org/x/sync/errgroup"
 	art "pdf-maker/internal/article"
 	"pdf-maker/internal/fetch"
 	"pdf-maker/internal/media"
@@ -25,6 +26,8 @@ func main() {
 	cleanupImages := flag.Bool("cleanup-images", true, "Delete downloaded images after PDF generation")
 	maxPar := flag.Int("max-par", 4, "Maximum parallel fetches")
 	timeout := flag.Duration("timeout", 90*time.Second, "Total operation timeout")
+	articleCacheDir := flag.String("article-cache-dir", "", "Directory for caching fetched article pages between runs (disabled when empty)")
+	articleCacheTTL := flag.Duration("article-cache-ttl", 6*time.Hour, "How long cached article pages are reused; pages unused for 4x this long are pruned at startup (0 keeps them forever)")
 	flag.Parse()
 
 	// Must provide either --urls or --articles-json
@@ -39,6 +42,12 @@ func main() {
 	ctx, cancel := context.WithTimeout(context.Background(), *timeout)
 	defer cancel()
 
+	if *articleCacheDir != "" {
+		if err := fetch.EnablePageCache(*articleCacheDir, *articleCacheTTL); err != nil {
+			fmt.Printf("Warning: article cache disabled: %v\n", err)
+		}
+	}
+
 	// Create image downloader
 	imgDownloader, err := media.NewDownloader("images")
 	if err != nil {
@@ -175,18 +184,33 @@ func processArticlesFromJSON(ctx context.Context, jsonPath string, imgDownloader
 	articlesToFetch := []string{}
 	articleIndices := []int{}
 
+	// Images embedded in provided content are downloaded in the background,
+	// overlapping with each other and with the URL fetches below
+	if maxPar <= 0 {
+		maxPar = 4
+	}
+	var imgGroup errgroup.Group
+	imgSem := make(chan struct{}, maxPar)
+
 	for i, input := range issueInput.Articles {
 		article := input.ToArticle()
 
 		// If content is provided directly, use it (but still download any embedded images)
 		if input.Content != "" {
 			if !input.RemoveImages {
-				processed, imgErr := imgDownloader.ProcessHTML(article.Content)
-				if imgErr != nil {
-					fmt.Printf("  [%d/%d] ⚠️  image processing failed for '%s': %v\n", i+1, len(issueInput.Articles), article.Title, imgErr)
-				} else {
-					article.Content = processed
-				}
+				i, article := i, article
+				imgGroup.Go(func() error {
+					imgSem <- struct{}{} // acquire
+					defer func() { <-imgSem }()
+
+					processed, imgErr := imgDownloader.ProcessHTML(article.Content)
+					if imgErr != nil {
+						fmt.Printf("  [%d/%d] ⚠️  image processing failed for '%s': %v\n", i+1, len(issueInput.Articles), article.Title, imgErr)
+					} else {
+						article.Content = processed
+					}
+					return nil // keep the original content on failure
+				})
 			}
 			articles = append(articles, article)
 			fmt.Printf("  [%d/%d] Using provided content: %s\n", i+1, len(issueInput.Articles), article.Title)
@@ -246,6 +270,8 @@ func processArticlesFromJSON(ctx context.Context, jsonPath string, imgDownloader
 		}
 	}
 
+	_ = imgGroup.Wait()
+
 	// Filter out articles with no content
 	validArticles := make([]*art.Article, 0, len(articles))
 	for _, a := range articles {
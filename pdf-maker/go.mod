@@ -4,12 +4,9 @@ go 1.22.0
 
 require (
 	github.com/PuerkitoBio/goquery v1.8.1
+	github.com/andybalholm/cascadia v1.3.1
+	golang.org/x/net v0.7.0
 	golang.org/x/sync v0.6.0
 )
 
-require (
-	github.com/andybalholm/cascadia v1.3.1 // indirect
-	golang.org/x/net v0.7.0 // indirect
-)
-
 // Additional dependencies will be added as features expand.
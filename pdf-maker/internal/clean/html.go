@@ -1,9 +1,12 @@
 package clean
 
 import (
+	"regexp"
 	"strings"
 
 	"github.com/PuerkitoBio/goquery"
+	"github.com/andybalholm/cascadia"
+	"golang.org/x/net/html"
 )
 
 // Stats tracks the number of elements removed/modified during cleaning.
@@ -17,50 +20,14 @@ type Stats struct {
 	ImagesRemoved       int
 }
 
-// CleanHTML removes subscription widgets, forms, and formats footnotes for better PDF rendering.
-// Returns cleaned HTML string and statistics about what was removed.
-func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
-	stats := Stats{}
-
-	doc, err := goquery.NewDocumentFromReader(strings.NewReader(htmlContent))
-	if err != nil {
-		return "", stats, err
-	}
-
-	// Remove subscription widgets
-	doc.Find("div.subscription-widget-wrap-editor").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.SubscriptionWidgets++
-	})
-
-	// Remove all forms (subscription forms, etc.)
-	doc.Find("form").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.Forms++
-	})
-
-	// Remove all input elements
-	doc.Find("input").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.Inputs++
-	})
-
-	// Remove elements with subscription-related classes
-	subscriptionSelectors := []string{
-		"[class*='subscription']",
-		"[class*='subscribe']",
-		"[class*='email-input']",
-		"[data-component-name*='Subscribe']",
-	}
-	for _, selector := range subscriptionSelectors {
-		doc.Find(selector).Each(func(i int, s *goquery.Selection) {
-			s.Remove()
-			stats.SubscriptionElems++
-		})
-	}
-
-	// Remove image control icons (expand, refresh buttons) and media controls
-	imageControlSelectors := []string{
+// Selectors used by CleanHTML, compiled once at package init instead of being
+// re-parsed by doc.Find on every article. Each removal group is a single
+// selector list; the unconditional groups are all matched during one walk of
+// the document (see removeMarkedNodes).
+var (
+	// Image control icons (expand, refresh buttons), media controls and
+	// link/share buttons (chain link icons)
+	iconMatcher = compileGroup(
 		".lucide-maximize2",
 		".lucide-refresh-cw",
 		".lucide-play",
@@ -82,16 +49,7 @@ func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
 		".restack-image",     // Restack image button
 		".view-image",        // View image button
 		".icon-container",    // Generic icon containers in image controls
-	}
-	for _, selector := range imageControlSelectors {
-		doc.Find(selector).Each(func(i int, s *goquery.Selection) {
-			s.Remove()
-			stats.ImageIcons++
-		})
-	}
-
-	// Remove link/share buttons (chain link icons)
-	linkButtonSelectors := []string{
+		// Link/share buttons (chain link icons)
 		"a[aria-label*='chain']",
 		"a[aria-label*='link']",
 		"button[aria-label*='chain']",
@@ -99,57 +57,12 @@ func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
 		"button[aria-label*='link']",
 		".pencraft.pc-reset._color-secondary_1iure_186[href='#']",
 		"svg[aria-label*='chain']",
-	}
-	for _, selector := range linkButtonSelectors {
-		doc.Find(selector).Each(func(i int, s *goquery.Selection) {
-			s.Remove()
-			stats.ImageIcons++
-		})
-	}
-
-	// Remove buttons containing lucide-link SVG icons
-	doc.Find("button").Each(func(i int, s *goquery.Selection) {
-		if s.Find("svg.lucide-link").Length() > 0 {
-			s.Remove()
-			stats.ImageIcons++
-		}
-	})
+	)
 
-	// Remove injected scripts (like live-server, analytics, etc.)
-	doc.Find("script").Each(func(i int, s *goquery.Selection) {
-		scriptContent, _ := s.Html()
-		// Remove live-server and similar development scripts
-		if strings.Contains(scriptContent, "live-server") ||
-			strings.Contains(scriptContent, "LiveServer") ||
-			strings.Contains(scriptContent, "live reload") {
-			s.Remove()
-		}
-	})
-
-	// Remove email input fields and subscribe buttons more aggressively
-	doc.Find("input[type='email']").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.Inputs++
-	})
-	doc.Find("button").Each(func(i int, s *goquery.Selection) {
-		text := strings.ToLower(s.Text())
-		if strings.Contains(text, "subscribe") || strings.Contains(text, "sign up") {
-			s.Remove()
-			stats.SubscriptionElems++
-		}
-	})
-
-	// Remove media players (audio/video elements and their containers)
-	doc.Find("audio").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.ImageIcons++
-	})
-	doc.Find("video").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		stats.ImageIcons++
-	})
-	// Remove media player containers by class patterns
-	mediaPlayerSelectors := []string{
+	// Media players: audio/video elements and their containers by class pattern
+	mediaPlayerMatcher = compileGroup(
+		"audio",
+		"video",
 		"[class*='audio-player']",
 		"[class*='video-player']",
 		"[class*='media-player']",
@@ -166,48 +79,214 @@ func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
 		"[class*='play-button']",
 		"[class*='pause-button']",
 		"[class*='media-control']",
+	)
+
+	subscriptionWidgetMatcher = cascadia.MustCompile("div.subscription-widget-wrap-editor")
+	formMatcher               = cascadia.MustCompile("form")
+	inputMatcher              = cascadia.MustCompile("input")
+	buttonMatcher             = cascadia.MustCompile("button")
+	lucideLinkMatcher         = cascadia.MustCompile("svg.lucide-link")
+	scriptMatcher             = cascadia.MustCompile("script")
+	mediaSymbolMatcher        = cascadia.MustCompile("button, div, span")
+
+	footnoteMatcher        = cascadia.MustCompile("div.footnote")
+	footnoteNumberMatcher  = cascadia.MustCompile("a.footnote-number")
+	footnoteContentMatcher = cascadia.MustCompile("div.footnote-content")
+
+	// Used by RemoveAllImages
+	imgMatcher = cascadia.MustCompile("img")
+	// Figures, picture elements and divs with image-related classes
+	imageContainerMatcher = compileGroup(
+		"figure",
+		"picture",
+		".captioned-image-container",
+		".captioned-image",
+		".image-container",
+		".post-image",
+		"[class*='image-']",
+		"[class*='Image']",
+	)
+)
+
+// Text patterns checked by CleanHTML. Each is matched in a single scan of the
+// element text rather than one strings.Contains call per pattern.
+const mediaControlSymbols = "⏸▶⏯⏭⏮⏹🔊🔇" // pause, play, play/pause, next, previous, stop, volume, mute
+
+var (
+	liveReloadRe    = regexp.MustCompile(`live-server|LiveServer|live reload`)
+	subscribeTextRe = regexp.MustCompile(`(?i)subscribe|sign up`)
+	mediaLabelRe    = regexp.MustCompile(`(?i)play|pause|audio|video|media`)
+)
+
+// compileGroup compiles the selectors as one comma-separated selector list,
+// panicking on an invalid one.
+func compileGroup(selectors ...string) cascadia.Selector {
+	return cascadia.MustCompile(strings.Join(selectors, ", "))
+}
+
+// removeAll detaches every node in sel from the document in a single batch and
+// returns how many nodes were removed. Matches are collected before mutation,
+// so removing an ancestor never invalidates the iteration over its descendants.
+func removeAll(sel *goquery.Selection) int {
+	n := sel.Length()
+	if n > 0 {
+		sel.Remove()
 	}
-	for _, selector := range mediaPlayerSelectors {
-		doc.Find(selector).Each(func(i int, s *goquery.Selection) {
-			s.Remove()
-			stats.ImageIcons++
-		})
+	return n
+}
+
+// removalCounter returns the Stats field that counts n if n is removed
+// unconditionally by CleanDocument, or nil to keep it. Rules are checked in
+// the order the separate removal passes used to run.
+func removalCounter(n *html.Node, stats *Stats) *int {
+	switch {
+	case subscriptionWidgetMatcher.Match(n):
+		return &stats.SubscriptionWidgets
+	case formMatcher.Match(n):
+		return &stats.Forms
+	case inputMatcher.Match(n): // includes email inputs
+		return &stats.Inputs
+	case isSubscriptionElement(n):
+		return &stats.SubscriptionElems
+	case iconMatcher.Match(n), mediaPlayerMatcher.Match(n):
+		return &stats.ImageIcons
+	}
+	return nil
+}
+
+// isSubscriptionElement reports whether n has a subscription-related class or
+// data-component-name. It is equivalent to the selector list
+// [class*='subscription'], [class*='subscribe'], [class*='email-input'],
+// [data-component-name*='Subscribe'], but reads each attribute once instead
+// of once per selector.
+func isSubscriptionElement(n *html.Node) bool {
+	for _, a := range n.Attr {
+		switch a.Key {
+		case "class":
+			if strings.Contains(a.Val, "subscri") &&
+				(strings.Contains(a.Val, "subscription") || strings.Contains(a.Val, "subscribe")) ||
+				strings.Contains(a.Val, "email-input") {
+				return true
+			}
+		case "data-component-name":
+			if strings.Contains(a.Val, "Subscribe") {
+				return true
+			}
+		}
+	}
+	return false
+}
+
+// removeMarkedNodes walks doc once, marking every element matched by
+// removalCounter without descending into it, then detaches the marked
+// elements. Each group used to be its own full-document walk.
+func removeMarkedNodes(doc *goquery.Document, stats *Stats) {
+	var marked []*html.Node
+	var walk func(n *html.Node)
+	walk = func(n *html.Node) {
+		for c := n.FirstChild; c != nil; c = c.NextSibling {
+			if c.Type == html.ElementNode {
+				if counter := removalCounter(c, stats); counter != nil {
+					*counter++
+					marked = append(marked, c)
+					continue
+				}
+			}
+			walk(c)
+		}
+	}
+	for _, root := range doc.Nodes {
+		walk(root)
+	}
+	for _, n := range marked {
+		n.Parent.RemoveChild(n)
 	}
+}
+
+// CleanHTML removes subscription widgets, forms, and formats footnotes for better PDF rendering.
+// Returns cleaned HTML string and statistics about what was removed.
+func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
+	// Nothing to clean: skip the parse and selector passes entirely
+	if strings.TrimSpace(htmlContent) == "" {
+		return "", Stats{}, nil
+	}
+
+	doc, err := goquery.NewDocumentFromReader(strings.NewReader(htmlContent))
+	if err != nil {
+		return "", Stats{}, err
+	}
+
+	stats := CleanDocument(doc)
+
+	cleaned, err := BodyHTML(doc, !strings.Contains(htmlContent, "<body"))
+	if err != nil {
+		return "", stats, err
+	}
+	return cleaned, stats, nil
+}
+
+// CleanDocument applies the CleanHTML rules to an already-parsed document in
+// place. Callers that go on to modify the same document (e.g. image caching)
+// can use it with BodyHTML to avoid a serialize/re-parse round trip.
+func CleanDocument(doc *goquery.Document) Stats {
+	stats := Stats{}
 
-	// Remove buttons and elements containing media control symbols (play, pause, etc.)
-	doc.Find("button, div, span").Each(func(i int, s *goquery.Selection) {
-		text := s.Text()
-		// Check for common media control symbols
-		if strings.Contains(text, "⏸") || // pause symbol
-			strings.Contains(text, "▶") || // play symbol
-			strings.Contains(text, "⏯") || // play/pause symbol
-			strings.Contains(text, "⏭") || // next track
-			strings.Contains(text, "⏮") || // previous track
-			strings.Contains(text, "⏹") || // stop symbol
-			strings.Contains(text, "🔊") || // volume symbol
-			strings.Contains(text, "🔇") { // mute symbol
-			s.Remove()
+	// Remove widgets, forms, inputs, subscription elements, icons and media
+	// players in a single walk over the document
+	removeMarkedNodes(doc, &stats)
+
+	// Remove buttons containing lucide-link SVG icons, and subscribe buttons
+	removeAll(doc.FindMatcher(buttonMatcher).FilterFunction(func(i int, s *goquery.Selection) bool {
+		if s.HasMatcher(lucideLinkMatcher).Length() > 0 {
 			stats.ImageIcons++
+			return true
+		}
+		if subscribeTextRe.MatchString(s.Text()) {
+			stats.SubscriptionElems++
+			return true
 		}
+		return false
+	}))
 
-		// Also check aria-label attributes for media controls
-		if ariaLabel, exists := s.Attr("aria-label"); exists {
-			lowerLabel := strings.ToLower(ariaLabel)
-			if strings.Contains(lowerLabel, "play") ||
-				strings.Contains(lowerLabel, "pause") ||
-				strings.Contains(lowerLabel, "audio") ||
-				strings.Contains(lowerLabel, "video") ||
-				strings.Contains(lowerLabel, "media") {
-				s.Remove()
-				stats.ImageIcons++
+	// Remove injected scripts (like live-server, analytics, etc.)
+	removeAll(doc.FindMatcher(scriptMatcher).FilterFunction(func(i int, s *goquery.Selection) bool {
+		scriptContent, _ := s.Html()
+		// Remove live-server and similar development scripts
+		return liveReloadRe.MatchString(scriptContent)
+	}))
+
+	// Remove buttons and elements containing media control symbols (play, pause, etc.).
+	// Element text is recomputed per candidate, so skip the text check entirely
+	// when the document contains none of the symbols. Candidates come in
+	// document order, so descendants of an element already marked for removal
+	// are skipped rather than re-checked and removed a second time.
+	checkSymbols := strings.ContainsAny(doc.Text(), mediaControlSymbols)
+	marked := make(map[*html.Node]bool)
+	stats.ImageIcons += removeAll(doc.FindMatcher(mediaSymbolMatcher).FilterFunction(func(i int, s *goquery.Selection) bool {
+		node := s.Get(0)
+		for p := node.Parent; p != nil; p = p.Parent {
+			if marked[p] {
+				return false
 			}
 		}
-	})
+
+		remove := checkSymbols && strings.ContainsAny(s.Text(), mediaControlSymbols)
+		if !remove {
+			// Also check aria-label attributes for media controls
+			if ariaLabel, exists := s.Attr("aria-label"); exists {
+				remove = mediaLabelRe.MatchString(ariaLabel)
+			}
+		}
+		if remove {
+			marked[node] = true
+		}
+		return remove
+	}))
 
 	// Format footnotes: convert multi-line footnotes to inline format
-	doc.Find("div.footnote").Each(func(i int, footnote *goquery.Selection) {
-		footnoteNum := footnote.Find("a.footnote-number").First()
-		footnoteContent := footnote.Find("div.footnote-content").First()
+	doc.FindMatcher(footnoteMatcher).Each(func(i int, footnote *goquery.Selection) {
+		footnoteNum := footnote.FindMatcher(footnoteNumberMatcher).First()
+		footnoteContent := footnote.FindMatcher(footnoteContentMatcher).First()
 
 		if footnoteNum.Length() > 0 && footnoteContent.Length() > 0 {
 			numberText := strings.TrimSpace(footnoteNum.Text())
@@ -248,22 +327,25 @@ func CleanHTML(htmlContent string, verbose bool) (string, Stats, error) {
 		}
 	})
 
-	// Get cleaned HTML
+	return stats
+}
+
+// BodyHTML serializes the body of a cleaned document. Set fragment when the
+// source HTML had no <body> tag so surrounding whitespace is trimmed.
+func BodyHTML(doc *goquery.Document, fragment bool) (string, error) {
 	cleaned, err := doc.Find("body").Html()
 	if err != nil {
-		return "", stats, err
+		return "", err
 	}
 
 	// If original content was a fragment (no body tag), extract just the body content
-	if !strings.Contains(htmlContent, "<body") {
+	if fragment {
 		cleaned = strings.TrimSpace(cleaned)
 	}
 
 	// Post-process: normalize whitespace and remove excessive line breaks
 	// This fixes issues where removed inline elements leave behind newlines
-	cleaned = normalizeWhitespace(cleaned)
-
-	return cleaned, stats, nil
+	return normalizeWhitespace(cleaned), nil
 }
 
 // normalizeWhitespace cleans up excessive whitespace and newlines in HTML
@@ -305,35 +387,10 @@ func RemoveAllImages(htmlContent string) (string, int, error) {
 	imagesRemoved := 0
 
 	// Remove all <img> tags
-	doc.Find("img").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-		imagesRemoved++
-	})
-
-	// Remove figure elements (which typically contain images)
-	doc.Find("figure").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-	})
-
-	// Remove picture elements (responsive image containers)
-	doc.Find("picture").Each(func(i int, s *goquery.Selection) {
-		s.Remove()
-	})
+	imagesRemoved += removeAll(doc.FindMatcher(imgMatcher))
 
-	// Remove divs with image-related classes
-	imageClassSelectors := []string{
-		".captioned-image-container",
-		".captioned-image",
-		".image-container",
-		".post-image",
-		"[class*='image-']",
-		"[class*='Image']",
-	}
-	for _, selector := range imageClassSelectors {
-		doc.Find(selector).Each(func(i int, s *goquery.Selection) {
-			s.Remove()
-		})
-	}
+	// Remove figure/picture elements and divs with image-related classes
+	removeAll(doc.FindMatcher(imageContainerMatcher))
 
 	// Get cleaned HTML
 	cleaned, err := doc.Find("body").Html()
@@ -5,6 +5,7 @@ import (
 	"strings"
 
 	"github.com/PuerkitoBio/goquery"
+	"golang.org/x/net/html"
 )
 
 // HTMLToTypst converts an HTML fragment (article body) into Typst markup.
@@ -19,6 +20,11 @@ func HTMLToTypst(htmlContent string, removeImages bool) (string, error) {
 	if strings.TrimSpace(htmlContent) == "" {
 		return "", nil
 	}
+	// Plain text (no tags or entities, nothing the parser would normalize)
+	// converts to itself, so skip building a document for it.
+	if !strings.ContainsAny(htmlContent, "<&\r\x00") {
+		return strings.TrimSpace(escapeTypst(htmlContent)), nil
+	}
 
 	doc, err := goquery.NewDocumentFromReader(strings.NewReader("<div id=\"__root\">" + htmlContent + "</div>"))
 	if err != nil {
@@ -26,32 +32,37 @@ func HTMLToTypst(htmlContent string, removeImages bool) (string, error) {
 	}
 
 	var sb strings.Builder
-	convertNode(doc.Find("#__root"), &sb, removeImages)
+	for _, root := range doc.Find("#__root").Nodes {
+		convertNode(root, &sb, removeImages)
+	}
 	return strings.TrimSpace(sb.String()), nil
 }
 
-// convertNode walks a goquery selection and emits Typst markup into sb.
-func convertNode(sel *goquery.Selection, sb *strings.Builder, removeImages bool) {
-	sel.Contents().Each(func(_ int, s *goquery.Selection) {
-		emitNode(s, sb, removeImages)
-	})
+// convertNode emits Typst markup for the children of n into sb. The tree is
+// walked through the parsed nodes directly rather than goquery selections, so
+// no Selection is allocated per node.
+func convertNode(n *html.Node, sb *strings.Builder, removeImages bool) {
+	for c := n.FirstChild; c != nil; c = c.NextSibling {
+		emitNode(c, sb, removeImages)
+	}
 }
 
 // emitNode emits a single node (element or text) as Typst markup.
-func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
-	if goquery.NodeName(s) == "#text" {
-		text := s.Text()
-		if text != "" {
-			sb.WriteString(escapeTypst(text))
+func emitNode(n *html.Node, sb *strings.Builder, removeImages bool) {
+	if n.Type == html.TextNode {
+		if n.Data != "" {
+			sb.WriteString(escapeTypst(n.Data))
 		}
 		return
 	}
+	if n.Type != html.ElementNode {
+		return
+	}
 
-	tag := goquery.NodeName(s)
-	switch tag {
+	switch n.Data {
 	case "p":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			sb.WriteString(body)
@@ -60,7 +71,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "h1":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			sb.WriteString("= ")
@@ -70,7 +81,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "h2":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			// h2 in article body → level 3 in Typst (below the depth:2 outline cap)
@@ -81,7 +92,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "h3":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			// Level 4 in Typst (====(level4)) so it stays below the outline
@@ -93,7 +104,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "h4", "h5", "h6":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			sb.WriteString("===== ")
@@ -103,7 +114,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "blockquote":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			// Typst block quote using a box with left border accent
@@ -114,9 +125,9 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "ul":
 		var listBuf strings.Builder
-		s.Children().Each(func(_ int, li *goquery.Selection) {
-			if goquery.NodeName(li) != "li" {
-				return
+		for li := n.FirstChild; li != nil; li = li.NextSibling {
+			if li.Type != html.ElementNode || li.Data != "li" {
+				continue
 			}
 			var inner strings.Builder
 			convertNode(li, &inner, removeImages)
@@ -126,7 +137,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 				listBuf.WriteString(body)
 				listBuf.WriteString("\n")
 			}
-		})
+		}
 		if listBuf.Len() > 0 {
 			sb.WriteString("#pad(x: 1.5em)[\n")
 			sb.WriteString(listBuf.String())
@@ -134,22 +145,22 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 		}
 
 	case "ol":
-		n := 1
+		num := 1
 		var listBuf strings.Builder
-		s.Children().Each(func(_ int, li *goquery.Selection) {
-			if goquery.NodeName(li) != "li" {
-				return
+		for li := n.FirstChild; li != nil; li = li.NextSibling {
+			if li.Type != html.ElementNode || li.Data != "li" {
+				continue
 			}
 			var inner strings.Builder
 			convertNode(li, &inner, removeImages)
 			body := strings.TrimSpace(inner.String())
 			if body != "" {
-				listBuf.WriteString(fmt.Sprintf("%d. ", n))
+				fmt.Fprintf(&listBuf, "%d. ", num)
 				listBuf.WriteString(body)
 				listBuf.WriteString("\n")
-				n++
+				num++
 			}
-		})
+		}
 		if listBuf.Len() > 0 {
 			sb.WriteString("#pad(x: 1.5em)[\n")
 			sb.WriteString(listBuf.String())
@@ -160,27 +171,33 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 		if removeImages {
 			return
 		}
-		src, exists := s.Attr("src")
+		src, exists := nodeAttr(n, "src")
 		if !exists || src == "" {
 			return
 		}
-		alt, _ := s.Attr("alt")
-		sb.WriteString(fmt.Sprintf("#figure(\n  image(%q, width: 100%%),\n", src))
+		alt, _ := nodeAttr(n, "alt")
+		fmt.Fprintf(sb, "#figure(\n  image(%q, width: 100%%),\n", src)
 		if alt != "" {
-			sb.WriteString(fmt.Sprintf("  caption: [%s],\n", escapeTypst(alt)))
+			fmt.Fprintf(sb, "  caption: [%s],\n", escapeTypst(alt))
 		}
 		sb.WriteString(")\n\n")
 
 	case "figure":
 		// Substack wraps images in <figure> with optional <figcaption>
-		img := s.Find("img").First()
-		caption := strings.TrimSpace(s.Find("figcaption").Text())
-		if img.Length() > 0 && !removeImages {
-			src, exists := img.Attr("src")
+		img := findFirst(n, "img")
+		var captionBuf strings.Builder
+		eachDescendant(n, func(c *html.Node) {
+			if c.Data == "figcaption" {
+				appendText(c, &captionBuf)
+			}
+		})
+		caption := strings.TrimSpace(captionBuf.String())
+		if img != nil && !removeImages {
+			src, exists := nodeAttr(img, "src")
 			if exists && src != "" {
-				sb.WriteString(fmt.Sprintf("#figure(\n  image(%q, width: 100%%),\n", src))
+				fmt.Fprintf(sb, "#figure(\n  image(%q, width: 100%%),\n", src)
 				if caption != "" {
-					sb.WriteString(fmt.Sprintf("  caption: [%s],\n", escapeTypst(caption)))
+					fmt.Fprintf(sb, "  caption: [%s],\n", escapeTypst(caption))
 				}
 				sb.WriteString(")\n\n")
 			}
@@ -188,7 +205,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "strong", "b":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			// Use #strong[...] function form (not *...*) so that whitespace
@@ -200,7 +217,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "em", "i":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			// Use #emph[...] function form (not _..._) so that e.g.
@@ -213,9 +230,9 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "a":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
-		href, _ := s.Attr("href")
+		href, _ := nodeAttr(n, "href")
 		if body == "" {
 			body = href
 		}
@@ -227,7 +244,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 			// escape hatch is a semicolon, which terminates the hash
 			// expression and is never included in rendered output.
 			// Example: "#link("u")[t];(more)" renders as link + "(more)".
-			sb.WriteString(fmt.Sprintf("#link(%q)[%s];", href, body))
+			fmt.Fprintf(sb, "#link(%q)[%s];", href, body)
 		} else {
 			sb.WriteString(body)
 		}
@@ -240,7 +257,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "code":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := inner.String()
 		if body != "" {
 			sb.WriteString("`")
@@ -251,7 +268,7 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 	case "pre":
 		var inner strings.Builder
 		// For pre, collect raw text
-		inner.WriteString(s.Text())
+		appendText(n, &inner)
 		body := inner.String()
 		if body != "" {
 			sb.WriteString("```\n")
@@ -262,28 +279,28 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 	case "sup":
 		// Substack footnote superscripts
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
-			sb.WriteString(fmt.Sprintf("#super[%s]", body))
+			fmt.Fprintf(sb, "#super[%s]", body)
 		}
 
 	case "sub":
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
-			sb.WriteString(fmt.Sprintf("#sub[%s]", body))
+			fmt.Fprintf(sb, "#sub[%s]", body)
 		}
 
 	case "span":
 		// Pass through span contents; styling from class is ignored (intentional)
-		convertNode(s, sb, removeImages)
+		convertNode(n, sb, removeImages)
 
 	case "div":
 		// Generic div: recurse into children, adding a paragraph break after
 		var inner strings.Builder
-		convertNode(s, &inner, removeImages)
+		convertNode(n, &inner, removeImages)
 		body := strings.TrimSpace(inner.String())
 		if body != "" {
 			sb.WriteString(body)
@@ -294,20 +311,31 @@ func emitNode(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 
 	case "table":
 		// Best-effort table conversion
-		emitTable(s, sb, removeImages)
+		emitTable(n, sb, removeImages)
+
+	case "style", "script", "noscript", "link", "template", "svg":
+		// Article-embedded stylesheets, scripts and inline vector icons carry
+		// no printable text; skip the whole subtree instead of emitting their
+		// raw contents as body text.
 
 	default:
 		// Unknown element: recurse into children
-		convertNode(s, sb, removeImages)
+		convertNode(n, sb, removeImages)
 	}
 }
 
 // emitTable converts a basic HTML table to Typst table syntax.
-func emitTable(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
+func emitTable(n *html.Node, sb *strings.Builder, removeImages bool) {
 	var rows [][]string
-	s.Find("tr").Each(func(_ int, tr *goquery.Selection) {
+	eachDescendant(n, func(tr *html.Node) {
+		if tr.Data != "tr" {
+			return
+		}
 		var row []string
-		tr.Find("th, td").Each(func(_ int, td *goquery.Selection) {
+		eachDescendant(tr, func(td *html.Node) {
+			if td.Data != "th" && td.Data != "td" {
+				return
+			}
 			var cell strings.Builder
 			convertNode(td, &cell, removeImages)
 			row = append(row, strings.TrimSpace(cell.String()))
@@ -326,20 +354,72 @@ func emitTable(s *goquery.Selection, sb *strings.Builder, removeImages bool) {
 		return
 	}
 
-	sb.WriteString(fmt.Sprintf("#table(\n  columns: %d,\n", cols))
+	fmt.Fprintf(sb, "#table(\n  columns: %d,\n", cols)
 	for _, row := range rows {
 		for _, cell := range row {
-			sb.WriteString(fmt.Sprintf("  [%s],\n", cell))
+			fmt.Fprintf(sb, "  [%s],\n", cell)
 		}
 	}
 	sb.WriteString(")\n\n")
 }
 
+// eachDescendant calls fn for every element below n in document order.
+func eachDescendant(n *html.Node, fn func(*html.Node)) {
+	for c := n.FirstChild; c != nil; c = c.NextSibling {
+		if c.Type == html.ElementNode {
+			fn(c)
+		}
+		eachDescendant(c, fn)
+	}
+}
+
+// findFirst returns the first element below n named tag, or nil.
+func findFirst(n *html.Node, tag string) *html.Node {
+	for c := n.FirstChild; c != nil; c = c.NextSibling {
+		if c.Type == html.ElementNode && c.Data == tag {
+			return c
+		}
+		if found := findFirst(c, tag); found != nil {
+			return found
+		}
+	}
+	return nil
+}
+
+// nodeAttr returns the value of attribute key on n.
+func nodeAttr(n *html.Node, key string) (string, bool) {
+	for _, a := range n.Attr {
+		if a.Key == key {
+			return a.Val, true
+		}
+	}
+	return "", false
+}
+
+// appendText writes the text of every text node below n into sb, matching
+// goquery's Selection.Text.
+func appendText(n *html.Node, sb *strings.Builder) {
+	for c := n.FirstChild; c != nil; c = c.NextSibling {
+		if c.Type == html.TextNode {
+			sb.WriteString(c.Data)
+		} else {
+			appendText(c, sb)
+		}
+	}
+}
+
+// typstSpecialChars are the characters escapeTypst prefixes with a backslash.
+const typstSpecialChars = "\\#$@_*`<>="
+
 // escapeTypst escapes characters that have special meaning in Typst markup.
 // Reference: https://typst.app/docs/reference/syntax/
 func escapeTypst(s string) string {
 	// Typst special characters that need escaping in content:
 	// \ # $ @ _ * ` < > =
+	// Most text runs contain none of them; return those without copying.
+	if !strings.ContainsAny(s, typstSpecialChars) {
+		return s
+	}
 	var sb strings.Builder
 	sb.Grow(len(s))
 	for _, r := range s {
@@ -16,6 +16,7 @@ import (
 	"time"
 
 	"github.com/PuerkitoBio/goquery"
+	"github.com/andybalholm/cascadia"
 	art "pdf-maker/internal/article"
 	"pdf-maker/internal/clean"
 	"pdf-maker/internal/media"
@@ -45,22 +46,23 @@ func FetchArticleWithImages(ctx context.Context, pageURL string, imageDownloader
         defer cancel()
     }
 
-    client := &http.Client{Timeout: 15 * time.Second}
-    req, err := http.NewRequestWithContext(ctx, http.MethodGet, pageURL, nil)
-    if err != nil { return nil, nil, fmt.Errorf("build request: %w", err) }
-    req.Header.Set("User-Agent", "newsletter2newspaper-fetcher/0.1 (+https://example.com)")
-    req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
-
-    resp, err := client.Do(req)
-    if err != nil { return nil, nil, fmt.Errorf("http get: %w", err) }
-    defer resp.Body.Close()
-    if resp.StatusCode != http.StatusOK { return nil, nil, fmt.Errorf("unexpected status %d", resp.StatusCode) }
-
-    const maxSize = 20 * 1024 * 1024
-    limited := &io.LimitedReader{R: resp.Body, N: maxSize + 1}
-    raw, err := io.ReadAll(limited)
-    if err != nil { return nil, nil, fmt.Errorf("read body: %w", err) }
-    if limited.N <= 0 { return nil, nil, errors.New("article exceeds size limit (20MB)") }
+    raw, fresh := readCachedPage(pageURL)
+    if !fresh {
+        // An expired cache entry is revalidated with a conditional GET; a 304
+        // reuses the cached page instead of downloading it again.
+        var stale pageValidators
+        if raw != nil { stale = cachedPageValidators(pageURL) }
+        body, validators, err := downloadPage(ctx, pageURL, stale)
+        switch {
+        case errors.Is(err, errNotModified):
+            touchCachedPage(pageURL)
+        case err != nil:
+            return nil, nil, err
+        default:
+            raw = body
+            writeCachedPage(pageURL, raw, validators)
+        }
+    }
 
     // Parse the document
     doc, err := goquery.NewDocumentFromReader(bytes.NewReader(raw))
@@ -89,35 +91,78 @@ func FetchArticleWithImages(ctx context.Context, pageURL string, imageDownloader
         }
     }
 
-    // Content extraction
-    if sel := doc.Find("div.available-content").First(); sel.Length() > 0 {
-        if inner, e := sel.Html(); e == nil { a.Content = inner }
-    }
-    if a.Content == "" { // fallback
-        if sel := doc.Find("div#entry").First(); sel.Length() > 0 { if inner, e := sel.Html(); e == nil { a.Content = inner } }
+    // Content extraction: move the matched container's children into a bare
+    // document instead of serializing them and parsing the string again.
+    // With no recognizable container the whole page is cleaned in place.
+    contentDoc, fragment := doc, false
+    if sel := findContent(doc); sel != nil {
+        shell, err := goquery.NewDocumentFromReader(strings.NewReader(emptyContentDocument))
+        if err != nil { return nil, nil, fmt.Errorf("parse html: %w", err) }
+        shell.Find("body").AppendSelection(sel.Contents())
+        contentDoc, fragment = shell, true
     }
-    if a.Content == "" { a.Content = string(raw) } // ultimate fallback
 
-    // Clean HTML content (remove subscription widgets, forms, format footnotes)
-    cleaned, _, err := clean.CleanHTML(a.Content, false)
-    if err == nil {
-        a.Content = cleaned
-    }
-    // If cleaning fails, we keep the uncleaned content rather than failing the whole fetch
+    // Clean the content (remove subscription widgets, forms, format footnotes)
+    // and cache its images on the same parsed document, serializing once at
+    // the end.
+    clean.CleanDocument(contentDoc)
 
     // Download images and rewrite URLs if downloader is provided
     if imageDownloader != nil {
-        processedContent, err := imageDownloader.ProcessHTML(a.Content)
-        if err == nil {
-            a.Content = processedContent
-        } else {
+        if err := imageDownloader.ProcessDocument(contentDoc); err != nil {
             fmt.Fprintf(os.Stderr, "Warning: failed to process images for %s: %v\n", pageURL, err)
         }
     }
 
+    processed, err := clean.BodyHTML(contentDoc, fragment)
+    if err != nil { return nil, nil, fmt.Errorf("render content: %w", err) }
+    a.Content = processed
+
     return a, raw, nil
 }
 
+// articleClient is shared by all article fetches so keep-alive connections
+// (and TLS sessions) to a publication's host are reused across articles
+// instead of being re-established for every page.
+var articleClient = &http.Client{
+    Timeout: 15 * time.Second,
+    Transport: func() *http.Transport {
+        t := http.DefaultTransport.(*http.Transport).Clone()
+        t.MaxIdleConnsPerHost = 8
+        return t
+    }(),
+}
+
+// errNotModified is returned by downloadPage when the server answers a
+// conditional request with 304 Not Modified.
+var errNotModified = errors.New("not modified")
+
+// downloadPage GETs pageURL and returns the response body (at most 20MB) with
+// the validators needed to revalidate it later. When v is non-empty the
+// request is conditional and errNotModified reports an unchanged page.
+func downloadPage(ctx context.Context, pageURL string, v pageValidators) ([]byte, pageValidators, error) {
+    req, err := http.NewRequestWithContext(ctx, http.MethodGet, pageURL, nil)
+    if err != nil { return nil, pageValidators{}, fmt.Errorf("build request: %w", err) }
+    req.Header.Set("User-Agent", "newsletter2newspaper-fetcher/0.1 (+https://example.com)")
+    req.Header.Set("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
+    if v.ETag != "" { req.Header.Set("If-None-Match", v.ETag) }
+    if v.LastModified != "" { req.Header.Set("If-Modified-Since", v.LastModified) }
+
+    resp, err := articleClient.Do(req)
+    if err != nil { return nil, pageValidators{}, fmt.Errorf("http get: %w", err) }
+    defer resp.Body.Close()
+    if resp.StatusCode == http.StatusNotModified && (v != pageValidators{}) { return nil, pageValidators{}, errNotModified }
+    if resp.StatusCode != http.StatusOK { return nil, pageValidators{}, fmt.Errorf("unexpected status %d", resp.StatusCode) }
+
+    const maxSize = 20 * 1024 * 1024
+    limited := &io.LimitedReader{R: resp.Body, N: maxSize + 1}
+    raw, err := io.ReadAll(limited)
+    if err != nil { return nil, pageValidators{}, fmt.Errorf("read body: %w", err) }
+    if limited.N <= 0 { return nil, pageValidators{}, errors.New("article exceeds size limit (20MB)") }
+
+    return raw, pageValidators{ETag: resp.Header.Get("ETag"), LastModified: resp.Header.Get("Last-Modified")}, nil
+}
+
 // FetchAndSaveArticle keeps backward compatibility: fetches article, saves content HTML, returns path.
 func FetchAndSaveArticle(ctx context.Context, pageURL, outDir string) (string, error) {
     artc, _, err := FetchArticle(ctx, pageURL)
@@ -131,6 +176,30 @@ func FetchAndSaveArticle(ctx context.Context, pageURL, outDir string) (string, e
     return outPath, nil
 }
 
+// contentMatcher finds every article body candidate in a single walk;
+// findContent then picks one by priority.
+var contentMatcher = cascadia.MustCompile("div.available-content, div#entry")
+
+// findContent returns the article body container: the first
+// div.available-content, otherwise the first div#entry, otherwise nil.
+func findContent(doc *goquery.Document) *goquery.Selection {
+    var entry *goquery.Selection
+    var found *goquery.Selection
+    doc.FindMatcher(contentMatcher).EachWithBreak(func(_ int, s *goquery.Selection) bool {
+        if s.HasClass("available-content") {
+            found = s
+            return false
+        }
+        if entry == nil { entry = s }
+        return true
+    })
+    if found == nil { found = entry }
+    return found
+}
+
+// emptyContentDocument is the shell an extracted article body is moved into.
+const emptyContentDocument = "<html><head></head><body></body></html>"
+
 var trailingSlash = regexp.MustCompile(`/+$`)
 var unsafeChars = regexp.MustCompile(`[^a-zA-Z0-9._-]+`)
 var datePattern = regexp.MustCompile(`\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) \d{2}, \d{4}\b`)
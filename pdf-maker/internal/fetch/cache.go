@@ -0,0 +1,168 @@
+package fetch
+
+import (
+	"crypto/sha1"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"time"
+)
+
+// pageCache holds raw article pages on disk so that repeated runs over
+// overlapping issues skip the network round trip. It is disabled (dir == "")
+// unless EnablePageCache is called.
+var pageCache struct {
+	dir string
+	ttl time.Duration
+}
+
+// Expired pages are kept for a while so they can still be revalidated with a
+// conditional GET; pruneExpiredAfter*ttl after their last write or
+// revalidation they are deleted. Temporary files older than staleTmpAge are
+// leftovers from interrupted writes.
+const (
+	pruneExpiredAfter = 4
+	staleTmpAge       = time.Hour
+)
+
+// EnablePageCache stores fetched article pages under dir and serves them for
+// up to ttl before fetching again. A ttl of zero keeps entries indefinitely.
+// Entries older than pruneExpiredAfter*ttl and stale temporary files are
+// removed when the cache is enabled, so the directory does not grow without
+// bound across runs.
+func EnablePageCache(dir string, ttl time.Duration) error {
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return fmt.Errorf("create page cache dir: %w", err)
+	}
+	pageCache.dir = dir
+	pageCache.ttl = ttl
+	pruneCache(time.Now())
+	return nil
+}
+
+// pruneCache deletes cache entries and temporary files that are too old to be
+// useful. Failures are ignored like other cache errors.
+func pruneCache(now time.Time) {
+	entries, err := os.ReadDir(pageCache.dir)
+	if err != nil {
+		return
+	}
+	for _, entry := range entries {
+		if !entry.Type().IsRegular() {
+			continue
+		}
+		name := entry.Name()
+		var maxAge time.Duration
+		switch {
+		case strings.HasPrefix(name, "page-") && strings.HasSuffix(name, ".tmp"):
+			maxAge = staleTmpAge
+		case strings.HasSuffix(name, ".html") || strings.HasSuffix(name, ".meta"):
+			if pageCache.ttl <= 0 {
+				continue
+			}
+			maxAge = pruneExpiredAfter * pageCache.ttl
+		default:
+			continue
+		}
+		info, err := entry.Info()
+		if err != nil || now.Sub(info.ModTime()) <= maxAge {
+			continue
+		}
+		os.Remove(filepath.Join(pageCache.dir, name))
+	}
+}
+
+// pageValidators are the HTTP cache validators stored alongside a cached page
+// so an expired entry can be revalidated with a conditional GET.
+type pageValidators struct {
+	ETag         string
+	LastModified string
+}
+
+// cachedPagePath returns the cache file for pageURL.
+func cachedPagePath(pageURL string) string {
+	return filepath.Join(pageCache.dir, fmt.Sprintf("%x.html", sha1.Sum([]byte(pageURL))))
+}
+
+// cachedMetaPath returns the validator sidecar file for pageURL.
+func cachedMetaPath(pageURL string) string {
+	return strings.TrimSuffix(cachedPagePath(pageURL), ".html") + ".meta"
+}
+
+// readCachedPage returns the cached page for pageURL and whether it is still
+// fresh. An expired page is returned with fresh == false so that it can be
+// reused if the server confirms it is unchanged.
+func readCachedPage(pageURL string) ([]byte, bool) {
+	if pageCache.dir == "" {
+		return nil, false
+	}
+	path := cachedPagePath(pageURL)
+	info, err := os.Stat(path)
+	if err != nil {
+		return nil, false
+	}
+	raw, err := os.ReadFile(path)
+	if err != nil {
+		return nil, false
+	}
+	fresh := pageCache.ttl <= 0 || time.Since(info.ModTime()) <= pageCache.ttl
+	return raw, fresh
+}
+
+// cachedPageValidators returns the validators stored for pageURL, if any.
+func cachedPageValidators(pageURL string) pageValidators {
+	data, err := os.ReadFile(cachedMetaPath(pageURL))
+	if err != nil {
+		return pageValidators{}
+	}
+	etag, lastModified, _ := strings.Cut(string(data), "\n")
+	return pageValidators{ETag: etag, LastModified: lastModified}
+}
+
+// touchCachedPage marks the cached page for pageURL as fresh again after the
+// server confirmed it is unchanged. The validators are touched too so that
+// pruneCache keeps them alongside the page.
+func touchCachedPage(pageURL string) {
+	now := time.Now()
+	_ = os.Chtimes(cachedPagePath(pageURL), now, now)
+	_ = os.Chtimes(cachedMetaPath(pageURL), now, now)
+}
+
+// writeCachedPage stores raw and its validators for pageURL. Failures are
+// ignored: the cache is an optimization and the page has already been
+// fetched. Files are written under a temporary name and renamed so
+// concurrent readers never see a partial page.
+func writeCachedPage(pageURL string, raw []byte, v pageValidators) {
+	if pageCache.dir == "" {
+		return
+	}
+	if writeFileAtomic(cachedPagePath(pageURL), raw) != nil {
+		return
+	}
+	if v == (pageValidators{}) {
+		os.Remove(cachedMetaPath(pageURL))
+		return
+	}
+	_ = writeFileAtomic(cachedMetaPath(pageURL), []byte(v.ETag+"\n"+v.LastModified))
+}
+
+// writeFileAtomic writes data to a temporary file in the cache directory and
+// renames it to path.
+func writeFileAtomic(path string, data []byte) error {
+	tmp, err := os.CreateTemp(pageCache.dir, "page-*.tmp")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), path)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+	}
+	return err
+}
@@ -43,10 +43,19 @@ func FetchArticlesConcurrentWithImages(ctx context.Context, urls []string, maxPa
 	sem := make(chan struct{}, maxParallel)
 	var mu sync.Mutex
 
+	// The same URL can appear more than once in an issue; fetch it once and
+	// fill in the repeats from the first result.
+	firstIndex := make(map[string]int, len(urls))
+	failed := make(map[string]error)
+
 	g, ctx := errgroup.WithContext(ctx)
 
 	for i, u := range urls {
 		i, u := i, u
+		if _, seen := firstIndex[u]; seen {
+			continue
+		}
+		firstIndex[u] = i
 		g.Go(func() error {
 			start := time.Now()
 			sem <- struct{}{} // acquire
@@ -57,6 +66,7 @@ func FetchArticlesConcurrentWithImages(ctx context.Context, urls []string, maxPa
 			mu.Lock()
 			defer mu.Unlock()
 			if err != nil {
+				failed[u] = err
 				errs = append(errs, fmt.Errorf("%s: %w", u, err))
 			} else {
 				results[i] = artc
@@ -68,6 +78,19 @@ func FetchArticlesConcurrentWithImages(ctx context.Context, urls []string, maxPa
 
 	_ = g.Wait() // collect all (ignoring aggregated error since we store per-URL errors)
 
+	for i, u := range urls {
+		first := firstIndex[u]
+		if first == i {
+			continue
+		}
+		if err, ok := failed[u]; ok {
+			errs = append(errs, fmt.Errorf("%s: %w", u, err))
+		} else if results[first] != nil {
+			dup := *results[first]
+			results[i] = &dup
+		}
+	}
+
 	// Compact successful results preserving original relative order
 	compacted := make([]*art.Article, 0, len(results))
 	for _, r := range results {
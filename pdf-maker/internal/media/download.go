@@ -8,7 +8,10 @@ import (
 	"net/url"
 	"os"
 	"path/filepath"
+	"regexp"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/PuerkitoBio/goquery"
@@ -78,6 +81,13 @@ func (d *Downloader) ProcessHTML(htmlContent string) (string, error) {
 	return modifiedHTML, err
 }
 
+// ProcessDocument downloads images referenced by an already-parsed document
+// and rewrites their src attributes in place.
+func (d *Downloader) ProcessDocument(doc *goquery.Document) error {
+	_, err := CacheDocumentImages(doc, d.opts)
+	return err
+}
+
 // Cleanup removes all downloaded images in the images directory.
 func (d *Downloader) Cleanup() error {
 	return os.RemoveAll(d.imagesDir)
@@ -94,10 +104,11 @@ type DownloadStats struct {
 
 // DownloadOptions configures image downloading behavior.
 type DownloadOptions struct {
-	ImagesDir string        // Directory to save images (default: "images")
-	Timeout   time.Duration // HTTP timeout per image (default: 10s)
-	UserAgent string        // Custom User-Agent header
-	Verbose   bool          // Enable verbose logging
+	ImagesDir   string        // Directory to save images (default: "images")
+	Timeout     time.Duration // HTTP timeout per image (default: 10s)
+	UserAgent   string        // Custom User-Agent header
+	Verbose     bool          // Enable verbose logging
+	MaxParallel int           // Maximum concurrent image downloads (default: 8)
 }
 
 // DownloadAndCacheImages downloads images from HTML content and replaces URLs with local file paths.
@@ -107,6 +118,55 @@ type DownloadOptions struct {
 // 3. Replaces src attributes with local file paths
 // 4. Returns modified HTML with local image references
 func DownloadAndCacheImages(htmlContent string, opts DownloadOptions) (string, DownloadStats, error) {
+	// Fragments without any <img> tag have nothing to rewrite; skip the
+	// parse/serialize round trip and return them as-is.
+	fragment := !strings.Contains(htmlContent, "<body")
+	if fragment && !imgTagRe.MatchString(htmlContent) {
+		return strings.TrimSpace(htmlContent), DownloadStats{}, nil
+	}
+
+	// Parse HTML
+	doc, err := goquery.NewDocumentFromReader(strings.NewReader(htmlContent))
+	if err != nil {
+		return "", DownloadStats{}, fmt.Errorf("parse html: %w", err)
+	}
+
+	stats, err := CacheDocumentImages(doc, opts)
+	if err != nil {
+		return "", stats, err
+	}
+
+	// Get modified HTML
+	html, err := doc.Find("body").Html()
+	if err != nil {
+		return "", stats, fmt.Errorf("extract html: %w", err)
+	}
+
+	// If original content was a fragment (no body tag), extract just the body content
+	if fragment {
+		html = strings.TrimSpace(html)
+	}
+
+	return html, stats, nil
+}
+
+// resolvedImages maps images dir + "\x00" + src to the local file already
+// holding that image, so a URL shared by several articles in a run (banners,
+// author avatars) is resolved once instead of being re-hashed and re-checked
+// on disk for every article that embeds it.
+var resolvedImages sync.Map
+
+// progressEvery is how many completed downloads pass between verbose
+// progress lines.
+const progressEvery = 25
+
+// imgTagRe matches the start of an <img> tag in raw HTML.
+var imgTagRe = regexp.MustCompile(`(?i)<img\b`)
+
+// CacheDocumentImages is the in-place form of DownloadAndCacheImages: it
+// downloads every <img> in doc that is not already cached and rewrites its src
+// to the local file, without serializing the document.
+func CacheDocumentImages(doc *goquery.Document, opts DownloadOptions) (DownloadStats, error) {
 	stats := DownloadStats{}
 
 	// Set defaults
@@ -120,12 +180,6 @@ func DownloadAndCacheImages(htmlContent string, opts DownloadOptions) (string, D
 		opts.UserAgent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 	}
 
-	// Parse HTML
-	doc, err := goquery.NewDocumentFromReader(strings.NewReader(htmlContent))
-	if err != nil {
-		return "", stats, fmt.Errorf("parse html: %w", err)
-	}
-
 	// Find all images
 	images := doc.Find("img")
 	stats.TotalImages = images.Length()
@@ -134,8 +188,7 @@ func DownloadAndCacheImages(htmlContent string, opts DownloadOptions) (string, D
 		if opts.Verbose {
 			fmt.Println("  - No images found in content")
 		}
-		html, _ := doc.Find("body").Html()
-		return html, stats, nil
+		return stats, nil
 	}
 
 	if opts.Verbose {
@@ -144,20 +197,42 @@ func DownloadAndCacheImages(htmlContent string, opts DownloadOptions) (string, D
 
 	// Create images directory
 	if err := os.MkdirAll(opts.ImagesDir, 0o755); err != nil {
-		return "", stats, fmt.Errorf("create images dir: %w", err)
+		return stats, fmt.Errorf("create images dir: %w", err)
 	}
 
-	// Create HTTP client with timeout
+	// Create HTTP client with timeout on the shared pooled transport
 	client := &http.Client{
-		Timeout: opts.Timeout,
+		Timeout:   opts.Timeout,
+		Transport: imageTransport,
 	}
 
-	// Process each image
+	// Pass 1: resolve cached images and collect the ones that need downloading.
+	// goquery selections are not safe for concurrent mutation, so all DOM
+	// updates stay on this goroutine; only the network I/O runs in parallel.
+	// Images sharing a src are grouped into one job so each URL is fetched once.
+	type imageJob struct {
+		imgs      []*goquery.Selection
+		src       string
+		localPath string
+		err       error
+	}
+	var jobs []*imageJob
+	jobsBySrc := make(map[string]*imageJob)
 	images.Each(func(i int, img *goquery.Selection) {
 		src, exists := img.Attr("src")
 		if !exists || src == "" {
 			return
 		}
+		if job, ok := jobsBySrc[src]; ok {
+			job.imgs = append(job.imgs, img)
+			return
+		}
+		resolvedKey := opts.ImagesDir + "\x00" + src
+		if localPath, ok := resolvedImages.Load(resolvedKey); ok {
+			useLocalImage(img, localPath.(string))
+			stats.Cached++
+			return
+		}
 
 		// Generate unique filename based on URL hash
 		urlHash := fmt.Sprintf("%x", md5.Sum([]byte(src)))
@@ -169,74 +244,131 @@ func DownloadAndCacheImages(htmlContent string, opts DownloadOptions) (string, D
 
 		// Check if image already exists (cached)
 		if _, err := os.Stat(localPath); err == nil {
-			if opts.Verbose {
-				fmt.Printf("  - Using cached image: %s\n", filename)
-			}
-			img.SetAttr("src", localPath)
-			// Remove srcset to prevent browser/wkhtmltopdf from using remote URLs
-			img.RemoveAttr("srcset")
-			// Also remove srcset from parent picture/source elements
-			img.Parent().Find("source").RemoveAttr("srcset")
+			resolvedImages.Store(resolvedKey, localPath)
+			useLocalImage(img, localPath)
 			stats.Cached++
 			return
 		}
 
-		// Download the image
-		if opts.Verbose {
-			truncatedSrc := src
-			if len(src) > 60 {
-				truncatedSrc = src[:60] + "..."
+		job := &imageJob{imgs: []*goquery.Selection{img}, src: src, localPath: localPath}
+		jobs = append(jobs, job)
+		jobsBySrc[src] = job
+	})
+
+	// Pass 2: download uncached images concurrently, bounded by MaxParallel.
+	// Verbose output is aggregated: a progress line every progressEvery
+	// downloads and one summary at the end rather than a line per image.
+	maxParallel := opts.MaxParallel
+	if maxParallel <= 0 {
+		maxParallel = 8
+	}
+	sem := make(chan struct{}, maxParallel)
+	var wg sync.WaitGroup
+	var completed atomic.Int32
+	for _, job := range jobs {
+		job := job
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			sem <- struct{}{} // acquire
+			defer func() { <-sem }()
+			job.err = downloadImageOnce(client, job.src, job.localPath, opts.UserAgent)
+			if n := completed.Add(1); opts.Verbose && n%progressEvery == 0 {
+				fmt.Printf("  - Downloaded %d/%d images...\n", n, len(jobs))
 			}
-			fmt.Printf("  - Downloading: %s\n", truncatedSrc)
-		}
+		}()
+	}
+	wg.Wait()
 
-		if err := downloadImage(client, src, localPath, opts.UserAgent); err != nil {
+	// Pass 3: apply download results to the document in original order.
+	for _, job := range jobs {
+		if job.err != nil {
 			stats.Failed++
-			stats.FailedURLs = append(stats.FailedURLs, src)
+			stats.FailedURLs = append(stats.FailedURLs, job.src)
 			if opts.Verbose {
-				errMsg := err.Error()
+				errMsg := job.err.Error()
 				if len(errMsg) > 60 {
 					errMsg = errMsg[:60] + "..."
 				}
 				fmt.Printf("    ❌ Failed to download image: %s\n", errMsg)
 			}
-			// Remove the img tag on failure
-			img.Remove()
-			return
+			// Remove the img tags on failure
+			for _, img := range job.imgs {
+				img.Remove()
+			}
+			continue
 		}
 
 		// Update img src to local path
-		img.SetAttr("src", localPath)
-		// Remove srcset to prevent browser/wkhtmltopdf from using remote URLs
-		img.RemoveAttr("srcset")
-		// Also remove srcset from parent picture/source elements
-		img.Parent().Find("source").RemoveAttr("srcset")
-		stats.Downloaded++
-
-		if opts.Verbose {
-			fmt.Printf("    ✅ Saved as: %s\n", filename)
+		resolvedImages.Store(opts.ImagesDir+"\x00"+job.src, job.localPath)
+		for _, img := range job.imgs {
+			useLocalImage(img, job.localPath)
 		}
-	})
+		stats.Downloaded++
+	}
 
 	if opts.Verbose {
-		fmt.Printf("  - Downloaded: %d images\n", stats.Downloaded)
-		fmt.Printf("  - Cached: %d images\n", stats.Cached)
-		fmt.Printf("  - Failed: %d images\n", stats.Failed)
-		fmt.Printf("  - Total processed: %d images\n", stats.TotalImages)
+		fmt.Printf("  - Images: downloaded=%d cached=%d failed=%d total=%d\n",
+			stats.Downloaded, stats.Cached, stats.Failed, stats.TotalImages)
 	}
 
-	// Get modified HTML
-	html, err := doc.Find("body").Html()
-	if err != nil {
-		return "", stats, fmt.Errorf("extract html: %w", err)
-	}
+	return stats, nil
+}
 
-	// If original content was a fragment (no body tag), extract just the body content
-	if !strings.Contains(htmlContent, "<body") {
-		html = strings.TrimSpace(html)
+// useLocalImage points img at a cached local file.
+func useLocalImage(img *goquery.Selection, localPath string) {
+	img.SetAttr("src", localPath)
+	// Remove srcset to prevent browser/wkhtmltopdf from using remote URLs
+	img.RemoveAttr("srcset")
+	// Also remove srcset from parent picture/source elements
+	img.Parent().Find("source").RemoveAttr("srcset")
+}
+
+// imageTransport is shared by every image download so connections to image
+// CDNs are kept alive across articles. Images for an issue mostly come from
+// a handful of hosts, so the idle pool per host is raised to match the
+// download parallelism instead of the default of two.
+var imageTransport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConns = 64
+	t.MaxIdleConnsPerHost = 16
+	return t
+}()
+
+// inflightDownload is a download in progress; done is closed once err is set.
+type inflightDownload struct {
+	done chan struct{}
+	err  error
+}
+
+var (
+	inflightMu sync.Mutex
+	inflight   = make(map[string]*inflightDownload)
+)
+
+// downloadImageOnce is downloadImage with concurrent requests for the same
+// local path collapsed into one. Articles in an issue are processed in
+// parallel and often share images (logos, avatars, hero images); the later
+// callers wait for the first download instead of fetching the URL again and
+// writing the same file concurrently.
+func downloadImageOnce(client *http.Client, imageURL, localPath, userAgent string) error {
+	inflightMu.Lock()
+	if call, ok := inflight[localPath]; ok {
+		inflightMu.Unlock()
+		<-call.done
+		return call.err
 	}
+	call := &inflightDownload{done: make(chan struct{})}
+	inflight[localPath] = call
+	inflightMu.Unlock()
 
-	return html, stats, nil
+	call.err = downloadImage(client, imageURL, localPath, userAgent)
+
+	inflightMu.Lock()
+	delete(inflight, localPath)
+	inflightMu.Unlock()
+	close(call.done)
+	return call.err
 }
 
 // downloadImage downloads an image from a URL and saves it to a local file.
@@ -262,46 +394,74 @@ func downloadImage(client *http.Client, imageURL, localPath, userAgent string) e
 		return fmt.Errorf("http status %d", resp.StatusCode)
 	}
 
-	// Create output file
-	outFile, err := os.Create(localPath)
+	// Borrow a copy buffer instead of allocating fresh buffers per image.
+	bufp := copyBufPool.Get().(*[]byte)
+	defer copyBufPool.Put(bufp)
+	buf := *bufp
+
+	// Sniff the image header from the response stream before touching the
+	// disk, so HTML error pages are rejected without a write/reopen round trip.
+	n, _ := io.ReadFull(resp.Body, buf[:imageHeaderLen])
+	if err := validateImageHeader(buf[:n]); err != nil {
+		return fmt.Errorf("corrupt image content: %w", err)
+	}
+
+	// Write to a temporary file and rename it into place once complete, so
+	// the cache never holds a truncated image under its final name.
+	outFile, err := os.CreateTemp(filepath.Dir(localPath), "download-*.part")
 	if err != nil {
 		return fmt.Errorf("create file: %w", err)
 	}
-	defer outFile.Close()
-
-	// Stream image data to file in chunks
-	_, err = io.Copy(outFile, resp.Body)
+	tmpPath := outFile.Name()
+
+	// Write the sniffed header, then stream the rest through the pooled
+	// buffer, stopping once the image exceeds maxImageSize. The writer is
+	// wrapped so io.CopyBuffer cannot bypass the buffer via
+	// (*os.File).ReadFrom, which allocates its own.
+	_, err = outFile.Write(buf[:n])
+	if err == nil {
+		limited := &io.LimitedReader{R: resp.Body, N: maxImageSize - int64(n) + 1}
+		_, err = io.CopyBuffer(struct{ io.Writer }{outFile}, limited, buf)
+		if err == nil && limited.N <= 0 {
+			err = fmt.Errorf("image exceeds size limit (%d MB)", maxImageSize>>20)
+		}
+	}
+	if closeErr := outFile.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmpPath, localPath)
+	}
 	if err != nil {
 		// Clean up partial file on error
-		os.Remove(localPath)
+		os.Remove(tmpPath)
 		return fmt.Errorf("write file: %w", err)
 	}
 
-	// Close before reading for validation
-	outFile.Close()
-	if err := validateImageFile(localPath); err != nil {
-		os.Remove(localPath)
-		return fmt.Errorf("corrupt image content: %w", err)
-	}
-
 	return nil
 }
 
-// validateImageFile checks that a file begins with a recognised image header.
-// Rejects HTML error pages, truncated downloads, and other non-image content.
-func validateImageFile(path string) error {
-	f, err := os.Open(path)
-	if err != nil {
-		return err
-	}
-	defer f.Close()
+// maxImageSize caps a single downloaded image.
+const maxImageSize = 20 * 1024 * 1024
+
+// copyBufPool holds the buffers downloadImage streams image bodies through.
+var copyBufPool = sync.Pool{
+	New: func() any {
+		buf := make([]byte, 32*1024)
+		return &buf
+	},
+}
 
-	buf := make([]byte, 12)
-	n, _ := f.Read(buf)
+// imageHeaderLen is the number of leading bytes validateImageHeader inspects.
+const imageHeaderLen = 12
+
+// validateImageHeader checks that data begins with a recognised image header.
+// Rejects HTML error pages, truncated downloads, and other non-image content.
+func validateImageHeader(b []byte) error {
+	n := len(b)
 	if n < 4 {
 		return fmt.Errorf("file too small (%d bytes)", n)
 	}
-	b := buf[:n]
 
 	switch {
 	case b[0] == 0xFF && b[1] == 0xD8 && b[2] == 0xFF: // JPEG
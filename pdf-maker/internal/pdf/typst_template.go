@@ -19,7 +19,7 @@ import (
 //   - Page settings (US Letter landscape, 3 columns, 0.75in margins)
 //   - Font + paragraph settings matching the prototype in typst.typ
 //   - Floating masthead: title, date/article-count line, rule
-//   - Table of contents (#outline())
+//   - Table of contents (#outline()), omitted for a single article
 //   - Per-article sections: heading with byline, then body content
 func AssembleNewspaperTypst(articles []*art.Article, title string) (string, error) {
 	if len(articles) == 0 {
@@ -80,9 +80,9 @@ func AssembleNewspaperTypst(articles []*art.Article, title string) (string, erro
 	sb.WriteString("  float: true,\n")
 	sb.WriteString("  {\n")
 	sb.WriteString("    align(center)[\n")
-	sb.WriteString(fmt.Sprintf("      #text(size: 28pt, weight: \"bold\")[%s]\n", escapeTypstContent(title)))
+	fmt.Fprintf(&sb, "      #text(size: 28pt, weight: \"bold\")[%s]\n", escapeTypstContent(title))
 	sb.WriteString("      #v(0.05em)\n")
-	sb.WriteString(fmt.Sprintf("      #text(size: 9pt, style: \"italic\")[\n        %s\n      ]\n", dateLine))
+	fmt.Fprintf(&sb, "      #text(size: 9pt, style: \"italic\")[\n        %s\n      ]\n", dateLine)
 	sb.WriteString("      #v(0.2em)\n")
 	sb.WriteString("      #line(length: 100%, stroke: 1.2pt)\n")
 	sb.WriteString("      #v(0.2em)\n")
@@ -91,38 +91,41 @@ func AssembleNewspaperTypst(articles []*art.Article, title string) (string, erro
 	sb.WriteString(")\n\n")
 
 	// ── Table of contents (bordered box) ────────────────────────────────────
-	sb.WriteString("#rect(stroke: 0.5pt, inset: (x: 0.8em, y: 0.7em), width: 100%, radius: 2pt)[\n")
-	sb.WriteString("#v(0.1em)\n")
-	sb.WriteString("#align(center)[#text(size: 12pt, weight: \"medium\")[IN THIS EDITION]]\n")
-	sb.WriteString("#v(0.3em)\n")
-	sb.WriteString("#line(length: 100%, stroke: 0.4pt)\n")
-	sb.WriteString("#v(0.3em)\n")
-	for i, a := range articles {
-		label := fmt.Sprintf("article-%d", i+1)
-		title := escapeTypstContent(a.Title)
-		var bp []string
-		if a.Author != "" {
-			bp = append(bp, escapeTypstContent(a.Author))
-		}
-		if a.Publication != "" {
-			bp = append(bp, escapeTypstContent(a.Publication))
-		}
-		byline := strings.Join(bp, " · ")
-		if byline != "" {
-			sb.WriteString(fmt.Sprintf(
-				"#link(<%s>)[*%s*]\\\n#text(size: 8pt, fill: gray, style: \"italic\")[%s]\n\n",
-				label, title, byline))
-		} else {
-			sb.WriteString(fmt.Sprintf("#link(<%s>)[*%s*]\n\n", label, title))
+	// A single article has nothing to navigate to, so skip the box entirely.
+	if len(articles) > 1 {
+		sb.WriteString("#rect(stroke: 0.5pt, inset: (x: 0.8em, y: 0.7em), width: 100%, radius: 2pt)[\n")
+		sb.WriteString("#v(0.1em)\n")
+		sb.WriteString("#align(center)[#text(size: 12pt, weight: \"medium\")[IN THIS EDITION]]\n")
+		sb.WriteString("#v(0.3em)\n")
+		sb.WriteString("#line(length: 100%, stroke: 0.4pt)\n")
+		sb.WriteString("#v(0.3em)\n")
+		for i, a := range articles {
+			label := fmt.Sprintf("article-%d", i+1)
+			title := escapeTypstContent(a.Title)
+			var bp []string
+			if a.Author != "" {
+				bp = append(bp, escapeTypstContent(a.Author))
+			}
+			if a.Publication != "" {
+				bp = append(bp, escapeTypstContent(a.Publication))
+			}
+			byline := strings.Join(bp, " · ")
+			if byline != "" {
+				fmt.Fprintf(&sb,
+					"#link(<%s>)[*%s*]\\\n#text(size: 8pt, fill: gray, style: \"italic\")[%s]\n\n",
+					label, title, byline)
+			} else {
+				fmt.Fprintf(&sb, "#link(<%s>)[*%s*]\n\n", label, title)
+			}
 		}
+		sb.WriteString("]\n")
+		sb.WriteString("#v(0.5em)\n\n")
 	}
-	sb.WriteString("]\n")
-	sb.WriteString("#v(0.5em)\n\n")
 
 	// ── Articles ────────────────────────────────────────────────────────────
 	for i, a := range articles {
 		// Labelled heading so the TOC #link(<article-N>) can target it
-		sb.WriteString(fmt.Sprintf("== %s <article-%d>\n\n", escapeTypstContent(a.Title), i+1))
+		fmt.Fprintf(&sb, "== %s <article-%d>\n\n", escapeTypstContent(a.Title), i+1)
 
 		// Byline
 		var bylineParts []string
@@ -136,16 +139,16 @@ func AssembleNewspaperTypst(articles []*art.Article, title string) (string, erro
 			bylineParts = append(bylineParts, a.PubDate.Format("January 2, 2006"))
 		}
 		if len(bylineParts) > 0 {
-			sb.WriteString(fmt.Sprintf("#text(size: 8pt, style: \"italic\")[%s]\n\n",
-				escapeTypstContent(strings.Join(bylineParts, " · "))))
+			fmt.Fprintf(&sb, "#text(size: 8pt, style: \"italic\")[%s]\n\n",
+				escapeTypstContent(strings.Join(bylineParts, " · ")))
 		}
 
 		// Article body
 		body, err := clean.HTMLToTypst(a.Content, a.RemoveImages)
 		if err != nil {
 			// Non-fatal: emit a note and continue
-			sb.WriteString(fmt.Sprintf("#text(fill: red)[Error rendering article: %s]\n\n",
-				escapeTypstContent(err.Error())))
+			fmt.Fprintf(&sb, "#text(fill: red)[Error rendering article: %s]\n\n",
+				escapeTypstContent(err.Error()))
 		} else if body != "" {
 			sb.WriteString(addDropCap(body))
 			sb.WriteString("\n\n")
@@ -226,9 +229,9 @@ func AssembleEssayTypst(articles []*art.Article, title string) (string, error) {
 	sb.WriteString("  float: true,\n")
 	sb.WriteString("  {\n")
 	sb.WriteString("    align(center)[\n")
-	sb.WriteString(fmt.Sprintf("      #text(size: 32pt, weight: \"bold\")[%s]\n", escapeTypstContent(title)))
+	fmt.Fprintf(&sb, "      #text(size: 32pt, weight: \"bold\")[%s]\n", escapeTypstContent(title))
 	sb.WriteString("      #v(-0.5em)\n")
-	sb.WriteString(fmt.Sprintf("      #text(size: 10pt, style: \"italic\")[\n        %s\n      ]\n", dateLine))
+	fmt.Fprintf(&sb, "      #text(size: 10pt, style: \"italic\")[\n        %s\n      ]\n", dateLine)
 	sb.WriteString("      #v(0.2em)\n")
 	sb.WriteString("      #line(length: 100%, stroke: 1.5pt)\n")
 	sb.WriteString("      #v(0.2em)\n")
@@ -255,11 +258,11 @@ func AssembleEssayTypst(articles []*art.Article, title string) (string, error) {
 	// 	}
 	// 	byline := strings.Join(bp, " · ")
 	// 	if byline != "" {
-	// 		sb.WriteString(fmt.Sprintf(
+	// 		fmt.Fprintf(&sb,
 	// 			"#link(<%s>)[*%s*]\\\n#text(size: 9pt, fill: gray, style: \"italic\")[%s]\n\n",
-	// 			label, articleTitle, byline))
+	// 			label, articleTitle, byline)
 	// 	} else {
-	// 		sb.WriteString(fmt.Sprintf("#link(<%s>)[*%s*]\n\n", label, articleTitle))
+	// 		fmt.Fprintf(&sb, "#link(<%s>)[*%s*]\n\n", label, articleTitle)
 	// 	}
 	// }
 	// sb.WriteString("]\n")
@@ -267,7 +270,7 @@ func AssembleEssayTypst(articles []*art.Article, title string) (string, error) {
 
 	// ── Articles ────────────────────────────────────────────────────────────
 	for i, a := range articles {
-		sb.WriteString(fmt.Sprintf("== %s <article-%d>\n\n", escapeTypstContent(a.Title), i+1))
+		fmt.Fprintf(&sb, "== %s <article-%d>\n\n", escapeTypstContent(a.Title), i+1)
 
 		// Byline
 		var bylineParts []string
@@ -281,15 +284,15 @@ func AssembleEssayTypst(articles []*art.Article, title string) (string, error) {
 			bylineParts = append(bylineParts, a.PubDate.Format("January 2, 2006"))
 		}
 		if len(bylineParts) > 0 {
-			sb.WriteString(fmt.Sprintf("#text(size: 9pt, style: \"italic\")[%s]\n\n",
-				escapeTypstContent(strings.Join(bylineParts, " · "))))
+			fmt.Fprintf(&sb, "#text(size: 9pt, style: \"italic\")[%s]\n\n",
+				escapeTypstContent(strings.Join(bylineParts, " · ")))
 		}
 
 		// Article body — no drop cap for essay format
 		body, err := clean.HTMLToTypst(a.Content, a.RemoveImages)
 		if err != nil {
-			sb.WriteString(fmt.Sprintf("#text(fill: red)[Error rendering article: %s]\n\n",
-				escapeTypstContent(err.Error())))
+			fmt.Fprintf(&sb, "#text(fill: red)[Error rendering article: %s]\n\n",
+				escapeTypstContent(err.Error()))
 		} else if body != "" {
 			sb.WriteString(body)
 			sb.WriteString("\n\n")
@@ -306,43 +309,29 @@ func AssembleEssayTypst(articles []*art.Article, title string) (string, error) {
 	return sb.String(), nil
 }
 
+// typstContentEscaper escapes the characters that are syntactically special
+// in Typst content. It is built once and shared; strings.Replacer returns
+// strings without any of them unchanged and without allocating.
+var typstContentEscaper = strings.NewReplacer(
+	`\`, `\\`,
+	`#`, `\#`,
+	`$`, `\$`,
+	`@`, `\@`,
+	`_`, `\_`,
+	`*`, `\*`,
+	"`", "\\`",
+	`<`, `\<`,
+	`>`, `\>`,
+	`=`, `\=`,
+	`[`, `\[`,
+	`]`, `\]`,
+)
+
 // escapeTypstContent escapes a plain-text string for use as Typst content
 // (inside square brackets or directly in the document body).
 // Only characters that are syntactically special in Typst content need escaping.
 func escapeTypstContent(s string) string {
-	var sb strings.Builder
-	sb.Grow(len(s))
-	for _, r := range s {
-		switch r {
-		case '\\':
-			sb.WriteString(`\\`)
-		case '#':
-			sb.WriteString(`\#`)
-		case '$':
-			sb.WriteString(`\$`)
-		case '@':
-			sb.WriteString(`\@`)
-		case '_':
-			sb.WriteString(`\_`)
-		case '*':
-			sb.WriteString(`\*`)
-		case '`':
-			sb.WriteString("\\`")
-		case '<':
-			sb.WriteString(`\<`)
-		case '>':
-			sb.WriteString(`\>`)
-		case '=':
-			sb.WriteString(`\=`)
-		case '[':
-			sb.WriteString(`\[`)
-		case ']':
-			sb.WriteString(`\]`)
-		default:
-			sb.WriteRune(r)
-		}
-	}
-	return sb.String()
+	return typstContentEscaper.Replace(s)
 }
 
 // addDropCap wraps the first body-text paragraph with the droplet package's
@@ -354,45 +343,50 @@ func escapeTypstContent(s string) string {
 // splitter enough text to fill all 3 lines beside the drop cap, so lines 2
 // and 3 visually wrap under line 1 rather than jumping to full column width.
 func addDropCap(body string) string {
-	paragraphs := strings.Split(body, "\n\n")
-	for i, para := range paragraphs {
-		trimmed := strings.TrimSpace(para)
-		if trimmed == "" {
-			continue
-		}
-		// Skip headings and Typst directives
-		if strings.HasPrefix(trimmed, "=") || strings.HasPrefix(trimmed, "#") {
-			continue
+	// Paragraphs are walked by offset rather than splitting and re-joining the
+	// whole body, since only the first one or two are rewritten.
+	paragraphAt := func(start int) (para string, next int) {
+		if j := strings.Index(body[start:], "\n\n"); j >= 0 {
+			return body[start : start+j], start + j + 2
 		}
-		if len([]rune(trimmed)) == 0 {
+		return body[start:], -1
+	}
+
+	for start := 0; start >= 0; {
+		para, next := paragraphAt(start)
+		trimmed := strings.TrimSpace(para)
+		// Skip blanks, headings and Typst directives
+		if trimmed == "" || strings.HasPrefix(trimmed, "=") || strings.HasPrefix(trimmed, "#") {
+			start = next
 			continue
 		}
 
 		// Absorb the next plain-text paragraph so the drop cap has enough text
 		// to fill its full height (3 lines) beside the capital letter.
 		content := trimmed
-		consumed := i + 1
-		for consumed < len(paragraphs) {
-			next := strings.TrimSpace(paragraphs[consumed])
-			if next == "" {
-				consumed++
+		rest := next
+		for rest >= 0 {
+			nextPara, after := paragraphAt(rest)
+			nextTrimmed := strings.TrimSpace(nextPara)
+			if nextTrimmed == "" {
+				rest = after
 				continue
 			}
-			if strings.HasPrefix(next, "=") || strings.HasPrefix(next, "#") {
+			if strings.HasPrefix(nextTrimmed, "=") || strings.HasPrefix(nextTrimmed, "#") {
 				break
 			}
-			content += "\n" + next
-			consumed++
+			content += "\n" + nextTrimmed
+			rest = after
 			break
 		}
 
 		dropcap := "#dropcap(height: 3, gap: 4pt, overhang: 6pt, font: \"Linux Libertine O\", weight: \"extrabold\")[\n" +
 			content + "\n]"
 
-		result := append([]string{}, paragraphs[:i]...)
-		result = append(result, dropcap)
-		result = append(result, paragraphs[consumed:]...)
-		return strings.Join(result, "\n\n")
+		if rest < 0 {
+			return body[:start] + dropcap
+		}
+		return body[:start] + dropcap + "\n\n" + body[rest:]
 	}
 	return body
 }